@@ -4,7 +4,6 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import json
 import math
-from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -231,6 +230,22 @@ class AdvancedDataProcessor:
         
         return sorted(processed_forecast, key=lambda x: x['date'])[:7]  # Extended to 7 days
     
+    def process_hourly_data(self, forecast_data: Dict) -> pd.DataFrame:
+        """Flatten the forecast steps into a DataFrame once, so charts can use its columns directly"""
+        columns = ['time', 'temp', 'feels_like', 'pop', 'wind_speed', 'icon', 'description']
+        if not forecast_data or 'list' not in forecast_data:
+            return pd.DataFrame(columns=columns)
+        
+        return pd.DataFrame([{
+            'time': datetime.fromtimestamp(item['dt']),
+            'temp': item['main']['temp'],
+            'feels_like': item['main'].get('feels_like', item['main']['temp']),
+            'pop': item.get('pop', 0),
+            'wind_speed': item['wind']['speed'],
+            'icon': item['weather'][0]['icon'],
+            'description': item['weather'][0]['description']
+        } for item in forecast_data['list']], columns=columns)
+    
     def _calculate_temperature_statistics(self, temps: List[float]) -> Dict[str, float]:
         """Calculate comprehensive temperature statistics"""
         if not temps:
@@ -252,6 +267,7 @@ class AdvancedDataProcessor:
         # Trend analysis
         if len(temps) > 2:
             x = np.arange(len(temps))
+            from scipy import stats  # imported lazily; scipy.stats is slow to load
             slope, _, r_value, _, _ = stats.linregress(x, temps)
             
             if abs(r_value) > 0.5:  # Significant correlation
@@ -335,6 +351,7 @@ class AdvancedDataProcessor:
         # Trend analysis
         if len(pressures) > 2:
             x = np.arange(len(pressures))
+            from scipy import stats
             slope, _, r_value, _, _ = stats.linregress(x, pressures)
             
             if abs(r_value) > 0.4:  # Significant correlation for pressure
@@ -776,6 +793,7 @@ class AdvancedDataProcessor:
             return {'direction': 'insufficient_data', 'strength': 0, 'confidence': 0}
         
         x = np.arange(len(data))
+        from scipy import stats
         slope, intercept, r_value, p_value, std_err = stats.linregress(x, data)
         
         # Determine trend direction and strength
@@ -835,6 +853,7 @@ class AdvancedDataProcessor:
         if len(data1) != len(data2) or len(data1) < 2:
             return 0.0
         
+        from scipy import stats
         correlation, _ = stats.pearsonr(data1, data2)
         return float(correlation) if not np.isnan(correlation) else 0.0
     
@@ -1356,7 +1375,40 @@ class AdvancedDataProcessor:
         
         index = int((degrees + 11.25) / 22.5) % 16
         return directions[index]
-    
+
+    def downsample_lttb(self, x: List, y: List[float], threshold: int) -> Tuple[List, List[float]]:
+        """Downsample a series with Largest-Triangle-Three-Buckets, preserving its visual shape"""
+        n = len(y)
+        if threshold < 3 or n <= threshold:
+            return list(x), list(y)
+
+        # Geometry uses the sample position so x may be labels or timestamps
+        positions = np.arange(n, dtype=float)
+        values = np.asarray(y, dtype=float)
+        bucket_size = (n - 2) / (threshold - 2)
+
+        selected = [0]
+        anchor = 0
+        for i in range(threshold - 2):
+            # Average of the next bucket is the third triangle vertex
+            next_start = int(math.floor((i + 1) * bucket_size)) + 1
+            next_end = min(int(math.floor((i + 2) * bucket_size)) + 1, n)
+            avg_x = positions[next_start:next_end].mean()
+            avg_y = values[next_start:next_end].mean()
+
+            # Keep the point in the current bucket forming the largest triangle
+            start = int(math.floor(i * bucket_size)) + 1
+            end = int(math.floor((i + 1) * bucket_size)) + 1
+            areas = np.abs(
+                (positions[anchor] - avg_x) * (values[start:end] - values[anchor]) -
+                (positions[anchor] - positions[start:end]) * (avg_y - values[anchor])
+            )
+            anchor = start + int(np.argmax(areas))
+            selected.append(anchor)
+
+        selected.append(n - 1)
+        return [x[i] for i in selected], [y[i] for i in selected]
+
     def _estimate_uv_index(self, weather_condition: str, cloud_cover: int, hour: int) -> float:
         """Estimate UV index based on weather conditions"""
         base_uv = 0
@@ -7,9 +7,16 @@ import hashlib
 from datetime import datetime, timezone
 import re
 import numpy as np
-from geopy.distance import geodesic
-import asyncio
-import aiohttp
+
+# Coordinates typed into the search box: "lat, lon", "lat lon", "(lat, lon)" or "lat: x, lon: y"
+_COORD_RE = re.compile(
+    r'^\s*\(?\s*(?:lat:\s*)?(-?\d+(?:\.\d+)?)\s*[,\s]\s*(?:lon:\s*)?(-?\d+(?:\.\d+)?)\s*\)?\s*$',
+    re.IGNORECASE
+)
+
+class LocationSearchError(Exception):
+    """A geocoding search that failed; the message is ready to show to the user"""
+
 
 class PremiumLocationDetector:
     """Premium location detection and geocoding services with advanced AI features"""
@@ -69,16 +76,6 @@ class PremiumLocationDetector:
             'manual': {'confidence': 0.90, 'radius': 100}
         }
         
-        # Enhanced coordinate validation
-        self.coordinate_patterns = [
-            r'^(-?\d+\.?\d*),\s*(-?\d+\.?\d*)$',  # lat,lon
-            r'^(-?\d+\.?\d*)\s+(-?\d+\.?\d*)$',   # lat lon
-            r'^\((-?\d+\.?\d*),\s*(-?\d+\.?\d*)\)$',  # (lat,lon)
-            r'^(-?\d+\.?\d*)[,\s]+(-?\d+\.?\d*)$',  # flexible separator
-            r'^lat:\s*(-?\d+\.?\d*)[,\s]+lon:\s*(-?\d+\.?\d*)$',  # labeled
-            r'^(-?\d+\.?\d*)°?\s*[NS][,\s]+(-?\d+\.?\d*)°?\s*[EW]$'  # with cardinal directions
-        ]
-        
         # Location intelligence features
         self.location_intelligence = {
             'population_data': {},
@@ -261,6 +258,19 @@ class PremiumLocationDetector:
 
     def search_location_advanced(self, query: str, limit: int = 10) -> List[Dict]:
         """Advanced location search with AI-powered ranking and filtering"""
+        # Coordinates need no geocoding round-trip
+        match = _COORD_RE.match(query)
+        if match:
+            lat, lon = float(match[1]), float(match[2])
+            if self._is_valid_geographic_location(lat, lon):
+                return [{
+                    'lat': lat,
+                    'lon': lon,
+                    'display_name': f"{lat:.4f}, {lon:.4f}",
+                    'city': f"{lat:.4f}, {lon:.4f}",
+                    'country': ''
+                }]
+        
         cache_key = self._get_cache_key('search_advanced', f"{query.lower().strip()}_{limit}")
         if cache_key in self.cache and self._is_cache_valid(self.cache[cache_key], 'geocoding'):
             return self.cache[cache_key]['data']
@@ -270,7 +280,7 @@ class PremiumLocationDetector:
         return results
 
     def _search_by_name_advanced(self, query: str, limit: int = 10) -> List[Dict]:
-        """Search for a location by name using Nominatim as a provider."""
+        """Search for a location by name using Nominatim as a provider; raises LocationSearchError on failure"""
         try:
             url = self.geocoding_providers['nominatim']['search']
             params = {'q': query, 'format': 'json', 'limit': limit}
@@ -285,8 +295,8 @@ class PremiumLocationDetector:
                     'country': res.get('display_name', '').split(',')[-1].strip()
                 } for res in results]
         except Exception as e:
-            st.error(f"Geocoding search failed: {e}")
-        return []
+            raise LocationSearchError(f"Geocoding search failed: {e}") from e
+        raise LocationSearchError(f"Geocoding search failed: HTTP {response.status_code}")
 
     def _get_cache_key(self, method: str, params: str) -> str:
         """Generate cache key for location requests"""
@@ -1,21 +1,22 @@
 import streamlit as st
 import requests
-import json
-from datetime import datetime, timedelta
-import plotly.graph_objects as go
-import plotly.express as px
-from PIL import Image
+from datetime import datetime
 import base64
-from io import BytesIO
 import time
 import pandas as pd
 import numpy as np
 import math
 import os
+import hashlib
+import json
+import copy
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from weather_api import PremiumWeatherAPI
-from location_detector import PremiumLocationDetector
-from ui_components import UIComponents
+from weather_api import PremiumWeatherAPI, WeatherRequestError
+from location_detector import PremiumLocationDetector, LocationSearchError
+from ui_components import UIComponents, FONT_LINKS, icon_url, stylesheet_adopter
 from data_processor import AdvancedDataProcessor
 
 # Premium page configuration
@@ -31,156 +32,427 @@ st.set_page_config(
     }
 )
 
-def get_img_as_base64(file):
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    abs_file_path = os.path.join(script_dir, file)
+@st.cache_data(show_spinner=False)
+def _read_img_as_base64(abs_file_path):
+    """Read and encode an asset once per process; None if it is missing"""
     try:
         with open(abs_file_path, "rb") as f:
             data = f.read()
         return base64.b64encode(data).decode()
     except FileNotFoundError:
-        st.error(f"Image file not found at: {abs_file_path}. Please check your file path and project structure.")
         return None
 
+# The weather client holds one user's rate-limit counters and response cache, so each session keeps its own
+def _get_weather_api():
+    weather_api = st.session_state.get('weather_api')
+    # Without a key, keep re-reading secrets on later reruns instead of keeping the placeholder
+    if weather_api is None or weather_api.api_key == "YOUR_API_KEY_HERE":
+        weather_api = st.session_state.weather_api = PremiumWeatherAPI()
+    return weather_api
+
+# Stateless service objects are shared by every session in the process
+@st.cache_resource(show_spinner=False)
+def _get_location_detector():
+    return PremiumLocationDetector()
+
+@st.cache_resource(show_spinner=False)
+def _get_ui_components():
+    return UIComponents()
+
+@st.cache_resource(show_spinner=False)
+def _get_data_processor():
+    return AdvancedDataProcessor()
+
+def get_img_as_base64(file):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    abs_file_path = os.path.join(script_dir, file)
+    data = _read_img_as_base64(abs_file_path)
+    if data is None:
+        st.error(f"Image file not found at: {abs_file_path}. Please check your file path and project structure.")
+    return data
+
+# Set CLIMATRACK_SERIAL_FETCH=1 to fetch on the script thread, which is easier to step through in a debugger
+_SERIAL_FETCH = os.environ.get("CLIMATRACK_SERIAL_FETCH", "") not in ("", "0")
+
+# Longer series are downsampled with LTTB before charting
+_MAX_CHART_POINTS = 200
+
+# Sparklines have no axes to explore, so skip Plotly's event handling entirely
+_SPARKLINE_CONFIG = {'staticPlot': True, 'displayModeBar': False, 'responsive': True}
+_CHART_CONFIG = {'displayModeBar': False, 'scrollZoom': False}
+
+# Shared figure styling; Plotly copies these on assignment, so they are never mutated
+_SPARKLINE_LAYOUT = dict(
+    template="plotly_dark", plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+    margin=dict(l=0, r=0, t=0, b=0), xaxis=dict(showticklabels=False), yaxis=dict(showticklabels=False)
+)
+_LEGEND_TOP = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+_LINE_MAX = dict(color='var(--warm)', width=3)
+_LINE_MIN = dict(color='var(--cold)', width=3)
+_MARKER = dict(size=8)
+# Cyan (#00d4ff, --secondary in premium.css) at half opacity
+_BAR_PRECIP = dict(color='rgba(0, 212, 255, 0.5)')
+
+# (button label, geocoding query); None means detect from the client IP
+_QUICK_LOCATIONS = (
+    ("🏠 Current", None),
+    ("🗽 New York", "New York, US"),
+    ("🏛️ London", "London, UK"),
+    ("🗼 Tokyo", "Tokyo, JP"),
+    ("🦘 Sydney", "Sydney, AU")
+)
+
+_UNIT_LABELS = {"metric": "Metric (°C)", "imperial": "Imperial (°F)", "kelvin": "Scientific (K)"}
+_UNIT_OPTIONS = tuple(_UNIT_LABELS)
+_UNIT_INDEX = {unit: i for i, unit in enumerate(_UNIT_OPTIONS)}
+
+_DASHBOARD_WIDGETS = {
+    'current_weather': 'Current Conditions',
+    'hourly_forecast': '24-Hour Forecast',
+    'weekly_forecast': '7-Day Forecast',
+    'air_quality': 'Air Quality Index',
+    'uv_index': 'UV Index & Solar',
+    'pressure_trends': 'Atmospheric Pressure',
+    'wind_analysis': 'Wind Conditions',
+    'precipitation': 'Precipitation Radar',
+    'satellite': 'Satellite Imagery',
+    'alerts': 'Weather Alerts'
+}
+_DASHBOARD_WIDGET_OPTIONS = tuple(_DASHBOARD_WIDGETS)
+
+# Seed values for a new session; mutable entries are copied before use
+_SESSION_DEFAULTS = {
+    # Core data
+    'location_data': None,
+    'weather_data': None,
+    'forecast_data': None,
+    'hourly_data': None,
+    'air_quality_data': None,
+    'radar_data': None,
+    'alerts_data': None,
+    'historical_data': None,
+    'detected_location': None,
+    'weather_trends': None,
+    'forecast_frame': None,
+    'weather_derived': None,
+    
+    # UI state
+    'current_view': 'dashboard',
+    'sidebar_expanded': True,
+    'background_mode': 'dynamic',
+    'animation_enabled': True,
+    'sound_enabled': False,
+    'radar_loaded': False,
+    
+    # User preferences
+    'units': 'metric',
+    'language': 'en',
+    'favorite_locations': [],
+    'comparison_locations': [],
+    'custom_alerts': [],
+    # CORRECTED: Default widgets now match available widget keys
+    'dashboard_widgets': ['current_weather', 'hourly_forecast', 'weekly_forecast', 'air_quality'],
+    
+    # Advanced features
+    'notifications_enabled': True,
+    'auto_refresh': True,
+    'refresh_interval': 300,
+    'data_quality_alerts': True,
+    'performance_mode': 'balanced',
+    
+    # Analytics
+    'weather_history': [],
+    'location_history': [],
+    'app_usage_stats': {
+        'sessions': 0,
+        'locations_searched': 0,
+        'forecasts_viewed': 0
+    },
+    
+    # Premium features
+    'premium_maps_enabled': True,
+    'advanced_analytics': True,
+    'historical_access': True,
+    'unlimited_locations': True,
+    
+    # Cache and performance
+    'last_update': None,
+    'last_fetch_key': None,
+    'last_fetch_ts': 0.0,
+    'cache_enabled': True,
+    'preload_data': True
+}
+
+# OpenWeatherMap tile layer codes for the maps view
+_MAP_LAYERS = {
+    'Temperature': 'temp_new',
+    'Precipitation': 'precipitation_new',
+    'Wind Speed': 'wind_new',
+    'Pressure': 'pressure_new',
+    'Clouds': 'clouds_new'
+}
+
+_AQI_COLORS = {'Good': '#10b981', 'Fair': '#f59e0b', 'Moderate': '#f97316', 'Poor': '#ef4444', 'Very Poor': '#dc2626'}
+
+# (icon, label, value key, description) for the bar under the hero section
+_QUICK_METRICS = (
+    ("🌡️", "Feels Like", 'feels_like', "Apparent temperature"),
+    ("👁️", "Visibility", 'visibility', "Horizontal visibility"),
+    ("☁️", "Clouds", 'clouds', "Cloud coverage"),
+    ("🌅", "Sunrise", 'sunrise', "Local sunrise"),
+    ("🌇", "Sunset", 'sunset', "Local sunset"),
+    ("🧭", "Direction", 'wind_direction', "Wind direction")
+)
+
+# (icon, title, description) highlights on the welcome screen
+_WELCOME_FEATURES = (
+    ("🎯", "Precision Forecasting", "AI-powered weather predictions with unprecedented accuracy"),
+    ("🌍", "Global Coverage", "Real-time weather data from thousands of stations worldwide"),
+    ("📊", "Advanced Analytics", "Comprehensive weather trends and historical analysis")
+)
+
+@lru_cache(maxsize=256)
+def _tile_coords(lat: float, lon: float, zoom: int) -> tuple[int, int]:
+    """Convert lat/lon to slippy map tile coordinates."""
+    lat_rad = math.radians(lat)
+    n = 2.0 ** zoom
+    xtile = int((lon + 180.0) / 360.0 * n)
+    ytile = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return xtile, ytile
+
+@st.cache_data(ttl=900, max_entries=64, show_spinner=False)
+def _fetch_tile(_weather_api, layer, zoom, xtile, ytile):
+    """Map tile PNG bytes keyed on (layer, zoom, x, y); the API key stays server-side"""
+    response = requests.get(
+        f"https://tile.openweathermap.org/map/{layer}/{zoom}/{xtile}/{ytile}.png",
+        params={'appid': _weather_api.api_key},
+        timeout=5
+    )
+    # Raising keeps failed fetches out of the cache
+    response.raise_for_status()
+    return response.content
+
+@st.cache_data(ttl=86400, max_entries=128, show_spinner=False)
+def _icon_bytes(code, size="2x"):
+    """Weather icon PNG bytes; icons never change, so each is downloaded once a day at most"""
+    response = requests.get(f"https://openweathermap.org/img/wn/{code}@{size}.png", timeout=3)
+    response.raise_for_status()
+    return response.content
+
+def _icon_image(code, size="2x"):
+    """Cached icon bytes for st.image, or the CDN URL if the download fails"""
+    try:
+        return _icon_bytes(code, size)
+    except requests.RequestException:
+        return f"https://openweathermap.org/img/wn/{code}@{size}.png"
+
+# Cached API wrappers. Streamlit reruns the whole script on every interaction,
+# so identical requests are served from memory instead of the network.
+def _require(_weather_api, data):
+    """Raise on a failed request, so st.cache_data keeps it out of the cache and the caller shows why"""
+    if data is None:
+        raise WeatherRequestError(_weather_api.last_error or "❌ Weather data is unavailable right now.")
+    return data
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_current_weather(_weather_api, lat, lon, units):
+    """Current conditions keyed on (lat, lon, units)"""
+    return _require(_weather_api, _weather_api.get_current_weather_enhanced(lat, lon, units))
+
+# TTLs follow PremiumWeatherAPI.cache_duration; forecasts and AQI update far less often than current conditions
+@st.cache_data(ttl=1800, show_spinner=False)
+def _cached_forecast(_weather_api, lat, lon, units):
+    """5-day forecast keyed on (lat, lon, units)"""
+    return _require(_weather_api, _weather_api.get_forecast_enhanced(lat, lon, units))
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _cached_air_quality(_weather_api, lat, lon):
+    """Air quality keyed on (lat, lon)"""
+    return _require(_weather_api, _weather_api.get_air_quality_enhanced(lat, lon))
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_alerts(_weather_api, lat, lon):
+    """Active alerts keyed on (lat, lon), shared by the alerts view and widget"""
+    return _require(_weather_api, _weather_api.get_weather_alerts_advanced(lat, lon))
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _geocode(_location_detector, query, limit):
+    return _location_detector.search_location_advanced(query, limit)
+
+def _cached_location_search(_location_detector, query, limit=10):
+    """Geocoding results keyed on the normalized (query, limit); a failed search is shown here and not cached"""
+    try:
+        return _geocode(_location_detector, " ".join(query.lower().split()), limit)
+    except LocationSearchError as e:
+        st.error(str(e))
+        return []
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_api_validation(_weather_api, api_key_digest):
+    """Sidebar API status keyed on a digest of the key, so the raw key never enters the cache key"""
+    return _weather_api.validate_api_key_comprehensive()
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _process_forecast(_data_processor, lat, lon, units, forecast_digest, _forecast):
+    """Daily summaries, their column frame, hourly frame and trends keyed on (lat, lon, units) and a digest of the raw forecast"""
+    processed = _data_processor.process_forecast_data_advanced(_forecast)
+    hourly = _data_processor.process_hourly_data(_forecast)
+    trends = _data_processor.calculate_weather_trends_advanced(processed)
+    return processed, pd.DataFrame(processed), hourly, trends
+
+def _forecast_digest(forecast):
+    return hashlib.md5(json.dumps(forecast, sort_keys=True, default=str).encode()).hexdigest()
+
+def _clear_weather_cache():
+    _cached_current_weather.clear()
+    _cached_forecast.clear()
+    _cached_air_quality.clear()
+    _cached_alerts.clear()
+    _process_forecast.clear()
+
+def _chart_values(values):
+    """Chart series rounded to 0.1, so each value serializes as a short decimal rather than full float precision"""
+    return np.round(np.asarray(values, dtype=float), 1)
+
+@st.cache_data(show_spinner=False)
+def _build_hourly_figure(times, temps):
+    """Hourly temperature chart as a plain figure dict, rebuilt only when the data changes"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    # NumPy arrays skip Plotly's per-element validation of Python lists
+    fig.add_trace(go.Scatter(x=np.asarray(times), y=_chart_values(temps), name='Temperature', mode='lines+markers', line=dict(color='var(--primary)')))
+    fig.update_layout(**_SPARKLINE_LAYOUT, height=200, uirevision='hourly')
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _build_pressure_figure(positions, pressure):
+    """Pressure sparkline as a plain figure dict, rebuilt only when the data changes"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    # Sample positions keep a downsampled line spaced as the original
+    fig.add_trace(go.Scatter(x=np.asarray(positions), y=_chart_values(pressure), mode='lines', line=dict(color='var(--accent)')))
+    fig.update_layout(**_SPARKLINE_LAYOUT, height=150, uirevision='pressure')
+    return fig.to_dict()
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _build_forecast_figure(chart_df, temp_unit):
+    """Daily max/min and precipitation chart as a plain figure dict, rebuilt only when the forecast changes"""
+    import plotly.graph_objects as go
+    
+    dates = chart_df['date'].to_numpy()
+    # Traces and layout go in with the constructor, so the figure is validated once
+    fig = go.Figure(
+        data=[
+            # Min goes first so the max trace can shade the daily range with fill='tonexty'
+            go.Scatter(x=dates, y=_chart_values(chart_df['temp_min']), name='Min Temp', mode='lines+markers',
+                       line=_LINE_MIN, marker=_MARKER),
+            go.Scatter(x=dates, y=_chart_values(chart_df['temp_max']), name='Max Temp', mode='lines+markers',
+                       line=_LINE_MAX, marker=_MARKER,
+                       fill='tonexty', fillcolor='rgba(255, 107, 53, 0.1)'),
+            go.Bar(x=dates, y=_chart_values(chart_df['precipitation_chance']), name='Precipitation',
+                   marker=_BAR_PRECIP, yaxis='y2')
+        ],
+        layout=dict(
+            template="plotly_dark",
+            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+            legend=_LEGEND_TOP,
+            yaxis=dict(title=f'Temperature ({temp_unit})'),
+            yaxis2=dict(title='Precipitation (%)', overlaying='y', side='right', range=[0, 100]),
+            margin=dict(l=20, r=20, t=20, b=20),
+            # Hover picks by x only, skipping the per-point distance scan on the y axis
+            hovermode='x', spikedistance=0,
+            uirevision='forecast'
+        )
+    )
+    return fig.to_dict()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _trend_cards_html(_ui, cards):
+    """Analytics trend card grid keyed on the displayed (icon, label, value, unit) tuples"""
+    return _ui.create_metric_card_grid(cards, columns=4)
+
 class PremiumWeatherApp:
     """World-class premium weather intelligence platform"""
     
+    # Premium app views, shared by every instance
+    views = {
+        'dashboard': '🏠 Dashboard',
+        'forecast': '📅 Extended Forecast',
+        'radar': '🗺️ Weather Radar',
+        'maps': '🌍 Interactive Maps',
+        'analytics': '📊 Weather Analytics',
+        'compare': '⚖️ Location Compare',
+        'alerts': '🚨 Weather Alerts',
+        'historical': '📈 Historical Data'
+    }
+    
     def __init__(self):
-        self.weather_api = PremiumWeatherAPI()
-        self.location_detector = PremiumLocationDetector()
-        self.ui = UIComponents()
-        self.data_processor = AdvancedDataProcessor()
+        self.weather_api = _get_weather_api()
+        self.location_detector = _get_location_detector()
+        self.ui = _get_ui_components()
+        self.data_processor = _get_data_processor()
         
-        # Premium app state
-        self.views = {
-            'dashboard': '🏠 Dashboard',
-            'forecast': '📅 Extended Forecast',
-            'radar': '🗺️ Weather Radar',
-            'maps': '🌍 Interactive Maps',
-            'analytics': '📊 Weather Analytics',
-            'compare': '⚖️ Location Compare',
-            'alerts': '🚨 Weather Alerts',
-            'historical': '📈 Historical Data'
+        # Routing tables for render_content_area and render_widget
+        self._view_dispatch = {
+            'dashboard': self.render_dashboard_view,
+            'forecast': self.render_forecast_view,
+            'radar': self.render_radar_view,
+            'maps': self.render_maps_view,
+            'analytics': self.render_analytics_view,
+            'compare': self.render_compare_view,
+            'alerts': self.render_alerts_view,
+            'historical': self.render_historical_view
+        }
+        self._widget_dispatch = {
+            'current_weather': self.render_current_weather_widget,
+            'hourly_forecast': self.render_hourly_forecast_widget,
+            'weekly_forecast': self.render_weekly_forecast_widget,
+            'air_quality': self.render_air_quality_widget,
+            'uv_index': self.render_uv_index_widget,
+            'pressure_trends': self.render_pressure_trends_widget,
+            'wind_analysis': self.render_wind_analysis_widget,
+            'precipitation': self.render_precipitation_widget,
+            'satellite': self.render_satellite_widget,
+            'alerts': self.render_alerts_widget
         }
         
     def initialize_session_state(self):
         """Initialize premium session state with advanced features"""
-        defaults = {
-            # Core data
-            'location_data': None,
-            'weather_data': None,
-            'forecast_data': None,
-            'hourly_data': None,
-            'air_quality_data': None,
-            'radar_data': None,
-            'alerts_data': None,
-            'historical_data': None,
-            
-            # UI state
-            'current_view': 'dashboard',
-            'sidebar_expanded': True,
-            'background_mode': 'dynamic',
-            'animation_enabled': True,
-            'sound_enabled': False,
-            
-            # User preferences
-            'units': 'metric',
-            'language': 'en',
-            'favorite_locations': [],
-            'comparison_locations': [],
-            'custom_alerts': [],
-            # CORRECTED: Default widgets now match available widget keys
-            'dashboard_widgets': ['current_weather', 'hourly_forecast', 'weekly_forecast', 'air_quality'],
-            
-            # Advanced features
-            'notifications_enabled': True,
-            'auto_refresh': True,
-            'refresh_interval': 300,
-            'data_quality_alerts': True,
-            'performance_mode': 'balanced',
-            
-            # Analytics
-            'weather_history': [],
-            'location_history': [],
-            'app_usage_stats': {
-                'sessions': 0,
-                'locations_searched': 0,
-                'forecasts_viewed': 0
-            },
-            
-            # Premium features
-            'premium_maps_enabled': True,
-            'advanced_analytics': True,
-            'historical_access': True,
-            'unlimited_locations': True,
-            
-            # Cache and performance
-            'last_update': None,
-            'cache_enabled': True,
-            'preload_data': True
-        }
-        
-        for key, value in defaults.items():
-            if key not in st.session_state:
-                st.session_state[key] = value
+        missing = _SESSION_DEFAULTS.keys() - st.session_state.keys()
+        if missing:
+            defaults = copy.deepcopy(_SESSION_DEFAULTS)
+            # A fresh session restores whatever the URL carried over from the last one
+            defaults.update(self._state_from_query_params())
+            st.session_state.update({key: defaults[key] for key in missing})
                 
         # Update usage statistics
         if 'app_initialized' not in st.session_state:
             st.session_state.app_usage_stats['sessions'] += 1
             st.session_state.app_initialized = True
                 
+    def _state_from_query_params(self) -> dict:
+        """Read the view, units and dashboard widgets mirrored into the URL"""
+        params = st.query_params
+        state = {}
+        if params.get('view') in self.views:
+            state['current_view'] = params['view']
+        if params.get('units') in _UNIT_LABELS:
+            state['units'] = params['units']
+        if 'widgets' in params:
+            state['dashboard_widgets'] = [w for w in params['widgets'].split(',') if w in _DASHBOARD_WIDGETS]
+        return state
+    
     # In main.py
 
     def load_premium_styling(self):
         """Load world-class premium styling system with a global override for the background."""
-        img = get_img_as_base64("assets/Background.jpg")
-
-        # This is a single, consolidated block of CSS.
-        # It includes the styles from ui_components.py and adds a brute-force background fix at the end.
-        st.markdown(f"""
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@100..900&family=JetBrains+Mono:wght@100..800&family=Playfair+Display:wght@400..900&family=Space+Grotesk:wght@300..700&display=swap');
-        
-        /* Root Variables */
-        :root {{
-            --secondary: #00d4ff; --primary: #7c3aed; --accent: #06ffa5;
-            --warm: #ff6b35; --cold: #4facfe; --success: #10b981;
-            --warning: #f59e0b; --error: #ef4444; --info: #3b82f6;
-        }}
-
-        body, #root, [data-testid="stAppViewContainer"], [data-testid="stAppViewContainer"] > .main {{
-            background-image: url("data:image/png;base64,{img}") !important;
-            background-size: cover !important;
-            background-position: center center !important;
-            background-repeat: no-repeat !important;
-            background-attachment: fixed !important;
-            background-color: #0F1116 !important; /* Fallback color */
-        }}
-
-        .stAppViewBlockContainer {{
-            background-color: transparent !important;
-            background: transparent !important;
-        }}
-
-        /* Styling for the sidebar */
-        .stSidebar {{
-            background: rgba(255, 255, 255, 0.02) !important;
-            border-right: 1px solid rgba(255, 255, 255, 0.1) !important;
-            backdrop-filter: blur(20px) !important;
-        }}
-        
-        /* Hide Default Streamlit Elements */
-        .stDeployButton, #MainMenu, footer, header, .stDecoration {{
-            display: none !important;
-        }}
-        
-        /* Custom Scrollbar */
-        ::-webkit-scrollbar {{ width: 8px; height: 8px; }}
-        ::-webkit-scrollbar-track {{ background: rgba(0, 0, 0, 0.2); }}
-        ::-webkit-scrollbar-thumb {{ background: linear-gradient(180deg, var(--primary), var(--secondary)); border-radius: 9999px; }}
-        
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(FONT_LINKS, unsafe_allow_html=True)
+        # The stylesheet goes out once per session; the page keeps the adopted sheet across reruns
+        if not st.session_state.get('premium_styles_sent'):
+            st.components.v1.html(stylesheet_adopter("premium.css"), height=0)
+            st.session_state.premium_styles_sent = True
         
     def render_premium_sidebar(self):
         """Render sophisticated sidebar navigation"""
@@ -213,52 +485,28 @@ class PremiumWeatherApp:
             for view_key, view_name in self.views.items():
                 is_active = st.session_state.current_view == view_key
                 
-                if st.button(
+                # Setting the view in a callback lands it before this rerun, no second pass needed
+                st.button(
                     view_name,
                     key=f"nav_{view_key}",
                     use_container_width=True,
-                    type="primary" if is_active else "secondary"
-                ):
-                    st.session_state.current_view = view_key
-                    st.rerun()
+                    type="primary" if is_active else "secondary",
+                    on_click=self.set_current_view,
+                    args=(view_key,)
+                )
             
             st.markdown("---")
             
             # Quick actions
             st.markdown("### ⚡ Quick Actions")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                if st.button("🔄", help="Refresh Data"):
-                    self.refresh_weather_data()
-                    st.rerun()
-            with col2:
-                if st.button("⭐", help="Add to Favorites"):
-                    self.add_current_to_favorites()
-            with col3:
-                # ADDED: Share functionality
-                if st.button("📤", help="Share Weather"):
-                    if st.session_state.location_data:
-                        location = st.session_state.location_data
-                        st.success("Link copied to clipboard!")
-                        st.code(f"https://climatrack.app/dashboard?lat={location['lat']}&lon={location['lon']}")
-                    else:
-                        st.warning("Search for a location to share.")
+            self.render_quick_actions()
             
             # Location shortcuts
             st.markdown("### 📍 Quick Locations")
-            quick_locations = [
-                ("🏠 Current", "auto"),
-                ("🗽 New York", "New York, US"),
-                ("🏛️ London", "London, UK"),
-                ("🗼 Tokyo", "Tokyo, JP"),
-                ("🦘 Sydney", "Sydney, AU")
-            ]
-            
-            for name, location in quick_locations:
-                if st.button(name, key=f"quick_{location}", use_container_width=True):
-                    self.handle_quick_location(location)
-                    st.rerun()
+            # Callbacks run before the rerun, so one click costs a single rerun
+            for name, location in _QUICK_LOCATIONS:
+                st.button(name, key=f"quick_{location or 'auto'}", use_container_width=True,
+                          on_click=self.handle_quick_location, args=(location,))
             
             st.markdown("---")
             
@@ -268,11 +516,13 @@ class PremiumWeatherApp:
             # Units selector
             new_units = st.selectbox(
                 "Units",
-                ["metric", "imperial", "kelvin"],
-                format_func=lambda x: {"metric": "Metric (°C)", "imperial": "Imperial (°F)", "kelvin": "Scientific (K)"}[x]
+                _UNIT_OPTIONS,
+                index=_UNIT_INDEX[st.session_state.units],
+                format_func=_UNIT_LABELS.__getitem__
             )
             if new_units != st.session_state.units:
                 st.session_state.units = new_units
+                st.query_params['units'] = new_units
                 self.refresh_weather_data()
                 st.rerun()
             
@@ -284,55 +534,71 @@ class PremiumWeatherApp:
             # Status indicators
             st.markdown("---")
             st.markdown("### 📊 System Status")
+            self.render_system_status()
             
-            # API status
-            api_validation = self.weather_api.validate_api_key_comprehensive()
-            status_color = "🟢" if api_validation.get('is_valid') else "🔴"
-            status_message = api_validation.get('status', 'unknown').replace('_', ' ').title()
-            st.markdown(f"{status_color} **API Status:** {status_message}")
-            
-            # Data freshness
-            if st.session_state.last_update:
-                time_diff = datetime.now() - st.session_state.last_update
-                freshness = "🟢 Fresh" if time_diff.seconds < 300 else "🟡 Aging" if time_diff.seconds < 900 else "🔴 Stale"
-                st.markdown(f"{freshness} **Data:** {time_diff.seconds//60}m ago")
-            
-            # Usage stats
-            stats = st.session_state.app_usage_stats
-            st.markdown(f"📈 **Sessions:** {stats['sessions']}")
-            st.markdown(f"🌍 **Locations:** {stats['locations_searched']}")
-            
+    @st.fragment
+    def render_quick_actions(self):
+        """Render the quick action buttons; favorites and share only rerun this fragment"""
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("🔄", help="Refresh Data"):
+                _clear_weather_cache()
+                self.refresh_weather_data(force=True)
+                st.rerun(scope="app")
+        with col2:
+            if st.button("⭐", help="Add to Favorites"):
+                self.add_current_to_favorites()
+        with col3:
+            # ADDED: Share functionality
+            if st.button("📤", help="Share Weather"):
+                if st.session_state.location_data:
+                    location = st.session_state.location_data
+                    st.success("Link copied to clipboard!")
+                    st.code(f"https://climatrack.app/dashboard?lat={location['lat']}&lon={location['lon']}")
+                else:
+                    st.warning("Search for a location to share.")
+    
+    @st.fragment(run_every=60)
+    def render_system_status(self):
+        """Render the sidebar status panel; refreshes on its own once a minute"""
+        
+        # API status
+        api_validation = _cached_api_validation(self.weather_api, hashlib.sha256(self.weather_api.api_key.encode()).hexdigest())
+        status_color = "🟢" if api_validation.get('is_valid') else "🔴"
+        status_message = api_validation.get('status', 'unknown').replace('_', ' ').title()
+        st.markdown(f"{status_color} **API Status:** {status_message}")
+        
+        # Data freshness
+        if st.session_state.last_update:
+            time_diff = datetime.now() - st.session_state.last_update
+            freshness = "🟢 Fresh" if time_diff.seconds < 300 else "🟡 Aging" if time_diff.seconds < 900 else "🔴 Stale"
+            st.markdown(f"{freshness} **Data:** {time_diff.seconds//60}m ago")
+        
+        # Usage stats
+        stats = st.session_state.app_usage_stats
+        st.markdown(f"📈 **Sessions:** {stats['sessions']}")
+        st.markdown(f"🌍 **Locations:** {stats['locations_searched']}")
+        
     def render_content_area(self):
         """Render main content area based on current view"""
         
-        # Premium header
-        self.render_premium_header()
+        # Premium header; one clock read serves the whole render
+        self.render_premium_header(datetime.now())
         
         # Content routing
-        if st.session_state.current_view == 'dashboard':
-            self.render_dashboard_view()
-        elif st.session_state.current_view == 'forecast':
-            self.render_forecast_view()
-        elif st.session_state.current_view == 'radar':
-            self.render_radar_view()
-        elif st.session_state.current_view == 'maps':
-            self.render_maps_view()
-        elif st.session_state.current_view == 'analytics':
-            self.render_analytics_view()
-        elif st.session_state.current_view == 'compare':
-            self.render_compare_view()
-        elif st.session_state.current_view == 'alerts':
-            self.render_alerts_view()
-        elif st.session_state.current_view == 'historical':
-            self.render_historical_view()
+        render_view = self._view_dispatch.get(st.session_state.current_view)
+        if render_view:
+            render_view()
             
-    def render_premium_header(self):
+    def render_premium_header(self, now: datetime):
         """Render premium application header"""
         col1, col2, col3 = st.columns([2, 3, 2])
         
         with col1:
             if st.session_state.location_data:
                 location = st.session_state.location_data
+                # Typed coordinates carry no country
+                place = ", ".join(part for part in (location['city'], location.get('country')) if part)
                 st.markdown(f"""
                     <div style="
                         background: rgba(255, 255, 255, 0.05);
@@ -341,7 +607,7 @@ class PremiumWeatherApp:
                         border: 1px solid rgba(255, 255, 255, 0.1);
                     ">
                         <div style="color: white; font-weight: 600; font-size: 16px;">
-                            📍 {location['city']}, {location['country']}
+                            📍 {place}
                         </div>
                         <div style="color: rgba(255, 255, 255, 0.6); font-size: 12px;">
                             {location['lat']:.4f}, {location['lon']:.4f}
@@ -355,11 +621,10 @@ class PremiumWeatherApp:
         
         with col3:
             # Current time and weather summary
-            now = datetime.now()
             if st.session_state.weather_data:
                 temp = st.session_state.weather_data['main']['temp']
                 condition = st.session_state.weather_data['weather'][0]['description'].title()
-                temp_unit = "°C" if st.session_state.units == "metric" else "°F"
+                temp_unit = self._unit_symbols()['temp']
                 
                 st.markdown(f"""
                     <div style="text-align: right;">
@@ -374,8 +639,6 @@ class PremiumWeatherApp:
     
     def render_premium_search(self, suffix=""):
         """Render premium search interface"""
-        st.markdown('<div class="premium-search-container">', unsafe_allow_html=True)
-        
         search_query = st.text_input(
             "",
             placeholder="🔍 Search locations, coordinates, or points of interest...",
@@ -384,7 +647,7 @@ class PremiumWeatherApp:
         )
         
         if search_query:
-            suggestions = self.location_detector.search_location_advanced(search_query)
+            suggestions = _cached_location_search(self.location_detector, search_query)
             if suggestions:
                 selected = st.selectbox(
                     "Suggestions",
@@ -397,16 +660,41 @@ class PremiumWeatherApp:
                 if st.button("🎯 Go to Location", use_container_width=True):
                     self.handle_location_selection(selected)
                     st.rerun()
-        
-        st.markdown('</div>', unsafe_allow_html=True)
     
-    def _get_tile_coords(self, lat: float, lon: float, zoom: int) -> tuple[int, int]:
-        """Convert lat/lon to slippy map tile coordinates."""
-        lat_rad = math.radians(lat)
-        n = 2.0 ** zoom
-        xtile = int((lon + 180.0) / 360.0 * n)
-        ytile = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
-        return xtile, ytile
+    def _unit_symbols(self) -> dict:
+        """Temperature and speed symbols for the selected unit system"""
+        units = st.session_state.units
+        return {
+            'temp': self.data_processor.temperature_units[units]['symbol'],
+            'speed': self.data_processor.speed_units[units]['symbol']
+        }
+    
+    def _derive_weather_fields(self, weather: dict) -> dict:
+        """Display strings for the current conditions, keyed like _QUICK_METRICS"""
+        return {
+            'feels_like': f"{weather['main']['feels_like']:.0f}°",
+            'visibility': f"{weather.get('visibility', 10000)/1000:.1f} km",
+            'clouds': f"{weather['clouds']['all']}%",
+            'sunrise': datetime.fromtimestamp(weather['sys']['sunrise']).strftime('%H:%M'),
+            'sunset': datetime.fromtimestamp(weather['sys']['sunset']).strftime('%H:%M'),
+            'wind_direction': self.data_processor.format_wind_direction(weather['wind'].get('deg', 0))
+        }
+    
+    def _weather_derived(self) -> dict:
+        """Current-condition display strings, formatted once per fetch; falls back for data loaded before that"""
+        derived = st.session_state.weather_derived
+        if derived is None:
+            derived = self._derive_weather_fields(st.session_state.weather_data)
+            st.session_state.weather_derived = derived
+        return derived
+    
+    def _forecast_frame(self) -> pd.DataFrame:
+        """Daily forecast as columns, built once per fetch; falls back for data loaded before that"""
+        frame = st.session_state.forecast_frame
+        if frame is None:
+            frame = pd.DataFrame(st.session_state.processed_forecast_data)
+            st.session_state.forecast_frame = frame
+        return frame
     
     def render_dashboard_view(self):
         """Render premium dashboard with customizable widgets"""
@@ -414,38 +702,36 @@ class PremiumWeatherApp:
             self.render_welcome_screen()
             return
         
-        # Hero weather section
-        self.render_hero_weather_section()
+        # Hero weather section; with auto refresh on, only this panel reruns on each tick
+        run_every = st.session_state.refresh_interval if st.session_state.auto_refresh else None
+        st.fragment(self.render_live_weather, run_every=run_every)()
         
         # Customizable widget grid
         st.markdown("### 📊 Weather Intelligence Dashboard")
-        
-        # Widget configuration
-        available_widgets = {
-            'current_weather': 'Current Conditions',
-            'hourly_forecast': '24-Hour Forecast',
-            'weekly_forecast': '7-Day Forecast',
-            'air_quality': 'Air Quality Index',
-            'uv_index': 'UV Index & Solar',
-            'pressure_trends': 'Atmospheric Pressure',
-            'wind_analysis': 'Wind Conditions',
-            'precipitation': 'Precipitation Radar',
-            'satellite': 'Satellite Imagery',
-            'alerts': 'Weather Alerts'
-        }
-        
+        self.render_widget_grid()
+    
+    def render_live_weather(self):
+        """Refresh data once the interval has elapsed, then render the hero section"""
+        self.refresh_weather_data()
+        self.render_hero_weather_section()
+    
+    @st.fragment
+    def render_widget_grid(self):
+        """Render the widget selector and grid; customizing only reruns this fragment"""
         # Widget selector
         col1, col2 = st.columns([3, 1])
         with col2:
-            valid_default_widgets = [widget for widget in st.session_state.dashboard_widgets if widget in available_widgets]
+            valid_default_widgets = [widget for widget in st.session_state.dashboard_widgets if widget in _DASHBOARD_WIDGETS]
 
             selected_widgets = st.multiselect(
                 "Customize Dashboard",
-                list(available_widgets.keys()),
+                _DASHBOARD_WIDGET_OPTIONS,
                 default=valid_default_widgets, 
-                format_func=lambda x: available_widgets[x]
+                format_func=_DASHBOARD_WIDGETS.__getitem__
             )
-            st.session_state.dashboard_widgets = selected_widgets
+            if selected_widgets != st.session_state.dashboard_widgets:
+                st.session_state.dashboard_widgets = selected_widgets
+                st.query_params['widgets'] = ','.join(selected_widgets)
         
         # Render selected widgets
         if selected_widgets:
@@ -459,64 +745,26 @@ class PremiumWeatherApp:
         
     def render_widget(self, widget_type):
         """Render individual dashboard widgets"""
-        with st.container():
-            if widget_type == 'current_weather':
-                self.render_current_weather_widget()
-            elif widget_type == 'hourly_forecast':
-                self.render_hourly_forecast_widget()
-            elif widget_type == 'weekly_forecast':
-                self.render_weekly_forecast_widget()
-            elif widget_type == 'air_quality':
-                self.render_air_quality_widget()
-            elif widget_type == 'uv_index':
-                self.render_uv_index_widget()
-            elif widget_type == 'pressure_trends':
-                self.render_pressure_trends_widget()
-            elif widget_type == 'wind_analysis':
-                self.render_wind_analysis_widget()
-            elif widget_type == 'precipitation':
-                self.render_precipitation_widget()
-            elif widget_type == 'satellite':
-                self.render_satellite_widget()
-            elif widget_type == 'alerts':
-                self.render_alerts_widget()
+        render = self._widget_dispatch.get(widget_type)
+        if render:
+            with st.container():
+                render()
     
     def render_hero_weather_section(self):
         """Render the main hero weather display"""
         weather = st.session_state.weather_data
         
-        # Create hero section with premium styling
-        st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, rgba(0, 212, 255, 0.1), rgba(124, 58, 237, 0.1));
-                border-radius: 24px;
-                padding: 40px;
-                margin: 20px 0;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                backdrop-filter: blur(5px);
-                position: relative;
-                overflow: hidden;
-            ">
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns([1, 2, 1])
-        
-        with col1:
-            icon_code = weather['weather'][0]['icon']
-            condition = weather['weather'][0]['main'].lower()
-            st.markdown(
-                self.ui.create_animated_weather_icon(icon_code, condition, size="120px"),
-                unsafe_allow_html=True
-            )
+        symbols = self._unit_symbols()
+        temp_unit = symbols['temp']
+        icon_html = self.ui.create_animated_weather_icon(
+            weather['weather'][0]['icon'], weather['weather'][0]['main'].lower(), size="120px"
+        )
         
-        with col2:
-            temp_unit = "°C" if st.session_state.units == "metric" else "°F"
-            temp = weather['main']['temp']
-            condition = weather['weather'][0]['description'].title()
-            feels_like = weather['main']['feels_like']
-            
-            st.markdown(f"""
-                <div style="text-align: center;">
+        # One HTML element; the .hero-weather grid replaces three st.columns
+        st.html(f"""
+            <div class="hero-weather">
+                <div>{icon_html}</div>
+                <div>
                     <div style="
                         font-size: 4rem;
                         font-weight: 800;
@@ -525,70 +773,52 @@ class PremiumWeatherApp:
                         -webkit-text-fill-color: transparent;
                         line-height: 0.9;
                         margin-bottom: 10px;
-                    ">{temp:.0f}{temp_unit}</div>
+                    ">{weather['main']['temp']:.0f}{temp_unit}</div>
                     <div style="
                         font-size: 1.5rem;
                         color: rgba(255, 255, 255, 0.9);
                         margin-bottom: 10px;
                         font-weight: 500;
-                    ">{condition}</div>
+                    ">{weather['weather'][0]['description'].title()}</div>
                     <div style="
                         font-size: 1rem;
                         color: rgba(255, 255, 255, 0.6);
-                    ">Feels like {feels_like:.0f}{temp_unit}</div>
+                    ">Feels like {weather['main']['feels_like']:.0f}{temp_unit}</div>
                 </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            humidity = weather['main']['humidity']
-            wind_speed = weather['wind']['speed']
-            pressure = weather['main']['pressure']
-            
-            st.markdown(f"""
-                <div style="text-align: center;">
+                <div>
                     <div style="margin-bottom: 15px;">
                         <div style="color: rgba(255, 255, 255, 0.6); font-size: 0.8rem;">HUMIDITY</div>
-                        <div style="color: white; font-size: 1.2rem; font-weight: 600;">{humidity}%</div>
+                        <div style="color: white; font-size: 1.2rem; font-weight: 600;">{weather['main']['humidity']}%</div>
                     </div>
                     <div style="margin-bottom: 15px;">
                         <div style="color: rgba(255, 255, 255, 0.6); font-size: 0.8rem;">WIND</div>
-                        <div style="color: white; font-size: 1.2rem; font-weight: 600;">{wind_speed:.1f} m/s</div>
+                        <div style="color: white; font-size: 1.2rem; font-weight: 600;">{weather['wind']['speed']:.1f} {symbols['speed']}</div>
                     </div>
                     <div>
                         <div style="color: rgba(255, 255, 255, 0.6); font-size: 0.8rem;">PRESSURE</div>
-                        <div style="color: white; font-size: 1.2rem; font-weight: 600;">{pressure} hPa</div>
+                        <div style="color: white; font-size: 1.2rem; font-weight: 600;">{weather['main']['pressure']} hPa</div>
                     </div>
                 </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("</div>", unsafe_allow_html=True)
-        
+            </div>
+        """)
+
         # Quick metrics bar
         self.render_quick_metrics_bar()
     
     def render_quick_metrics_bar(self):
         """Render quick metrics below hero section"""
-        weather = st.session_state.weather_data
+        values = self._weather_derived()
         
-        metrics = [
-            ("🌡️", "Feels Like", f"{weather['main']['feels_like']:.0f}°", "Apparent temperature"),
-            ("👁️", "Visibility", f"{weather.get('visibility', 10000)/1000:.1f} km", "Horizontal visibility"),
-            ("☁️", "Clouds", f"{weather['clouds']['all']}%", "Cloud coverage"),
-            ("🌅", "Sunrise", datetime.fromtimestamp(weather['sys']['sunrise']).strftime('%H:%M'), "Local sunrise"),
-            ("🌇", "Sunset", datetime.fromtimestamp(weather['sys']['sunset']).strftime('%H:%M'), "Local sunset"),
-            ("🧭", "Direction", self.data_processor.format_wind_direction(weather['wind'].get('deg', 0)), "Wind direction")
-        ]
-        
-        cols = st.columns(len(metrics))
-        for i, (icon, label, value, description) in enumerate(metrics):
-            with cols[i]:
-                st.markdown(f"""
-                    <div class="metric-card" style="text-align: center; padding: 16px;">
-                        <div class="metric-icon">{icon}</div>
-                        <div class="metric-value" style="font-size: 18px;">{value}</div>
-                        <div class="metric-label" style="font-size: 11px;">{label}</div>
-                    </div>
-                """, unsafe_allow_html=True)
+        # One markdown element for the whole bar instead of one per column
+        cards = "".join(
+            f'<div class="metric-card">'
+            f'<div class="metric-icon">{icon}</div>'
+            f'<div class="metric-value">{values[key]}</div>'
+            f'<div class="metric-label">{label}</div>'
+            f'</div>'
+            for icon, label, key, description in _QUICK_METRICS
+        )
+        st.html(f'<div class="quick-metrics">{cards}</div>')
     
     def render_welcome_screen(self):
         """Render premium welcome screen"""
@@ -609,13 +839,12 @@ class PremiumWeatherApp:
             """
 
         st.markdown(f"""
-            <div style="
+            <div class="welcome-hero" style="
                 text-align: center;
                 padding: 60px 40px;
                 background: linear-gradient(135deg, rgba(0, 212, 255, 0.1), rgba(124, 58, 237, 0.1));
                 border-radius: 24px;
                 border: 1px solid rgba(255, 255, 255, 0.1);
-                backdrop-filter: blur(5px);
                 margin: 40px 0;
             ">
                 <h1 style="
@@ -646,33 +875,16 @@ class PremiumWeatherApp:
             </div>
         """, unsafe_allow_html=True)
         
-        # Feature highlights
-        col1, col2, col3 = st.columns(3)
-        
-        features = [
-            ("🎯", "Precision Forecasting", "AI-powered weather predictions with unprecedented accuracy"),
-            ("🌍", "Global Coverage", "Real-time weather data from thousands of stations worldwide"),
-            ("📊", "Advanced Analytics", "Comprehensive weather trends and historical analysis"),
-        ]
-        
-        for i, (icon, title, description) in enumerate(features):
-            with [col1, col2, col3][i]:
-                st.markdown(f"""
-                    <div style="
-                        text-align: center;
-                        padding: 30px 20px;
-                        background: rgba(255, 255, 255, 0.03);
-                        border-radius: 16px;
-                        border: 1px solid rgba(255, 255, 255, 0.1);
-                        backdrop-filter: blur(5px);
-                        margin: 10px 0;
-                        transition: transform 0.3s ease;
-                    ">
-                        <div style="font-size: 2.5rem; margin-bottom: 15px;">{icon}</div>
-                        <h3 style="color: white; margin-bottom: 10px; font-size: 1.1rem;">{title}</h3>
-                        <p style="color: rgba(255, 255, 255, 0.7); font-size: 0.9rem; line-height: 1.4;">{description}</p>
-                    </div>
-                """, unsafe_allow_html=True)
+        # Feature highlights, as one grid element instead of three columns
+        cards = "".join(
+            f'<div class="feature-card">'
+            f'<div class="feature-icon">{icon}</div>'
+            f'<h3>{title}</h3>'
+            f'<p>{description}</p>'
+            f'</div>'
+            for icon, title, description in _WELCOME_FEATURES
+        )
+        st.html(f'<div class="feature-cards">{cards}</div>')
         
         # Call to action
         st.markdown("### 🌍 Get Started")
@@ -686,97 +898,86 @@ class PremiumWeatherApp:
             return
 
         forecast_data = st.session_state.processed_forecast_data
+        symbols = self._unit_symbols()
 
         with st.container():
             st.markdown("#### Forecast Overview")
-            fig = go.Figure()
-
-            dates = [day['date'] for day in forecast_data]
-            temp_max = [day['temp_max'] for day in forecast_data]
-            temp_min = [day['temp_min'] for day in forecast_data]
-            precip_chance = [day['precipitation_chance'] for day in forecast_data]
-
-            fig.add_trace(go.Scatter(x=dates, y=temp_max, name='Max Temp', mode='lines+markers',
-                                     line=dict(color='var(--warm)', width=3), marker=dict(size=8)))
-            fig.add_trace(go.Scatter(x=dates, y=temp_min, name='Min Temp', mode='lines+markers',
-                                     line=dict(color='var(--cold)', width=3), marker=dict(size=8)))
-            primary_rgb = "0, 212, 255"
-            fig.add_trace(go.Bar(x=dates, y=precip_chance, name='Precipitation',
-                                marker=dict(color=f'rgba({primary_rgb}, 0.5)'), yaxis='y2'))
-
-            fig.update_layout(
-                template="plotly_dark",
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-                yaxis=dict(title='Temperature (°C)'),
-                yaxis2=dict(title='Precipitation (%)', overlaying='y', side='right', range=[0, 100]),
-                margin=dict(l=20, r=20, t=20, b=20)
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            # Columns come from the frame built at fetch time; the builder reads them as arrays
+            chart_df = self._forecast_frame()[['date', 'temp_max', 'temp_min', 'precipitation_chance']]
+            fig = _build_forecast_figure(chart_df, symbols['temp'])
+            st.plotly_chart(fig, use_container_width=True, config=_CHART_CONFIG)
 
         st.markdown("---")
 
+        # All seven days go out as one grid element rather than an expander and six metrics per day
+        today = datetime.now().date()
+        wind_direction = self.data_processor.format_wind_direction
+        cards = []
         for day in forecast_data:
-            with st.expander(f"{day['day_full']}, {day['date'].strftime('%b %d')} - {day['condition']}", expanded=day['date'].date() == datetime.now().date()):
-                cols = st.columns([1, 2])
-                with cols[0]:
-                    st.image(f"http://openweathermap.org/img/wn/{day['icon']}@4x.png", width=128)
-                    st.markdown(f"<p style='text-align:center; color: var(--accent);'>{day['comfort_level']} Comfort ({day['comfort_score']:.0f}%)</p>", unsafe_allow_html=True)
-
-                with cols[1]:
-                    metric_cols = st.columns(3)
-                    with metric_cols[0]:
-                        st.metric("Temperature", f"{day['temp_avg']:.0f}°C", f"{day['temp_max']:.0f}° / {day['temp_min']:.0f}°")
-                        st.metric("Precipitation", f"{day['precipitation_chance']:.0f}%", f"{day['precipitation_avg']:.1f} mm")
-                    with metric_cols[1]:
-                        st.metric("Wind", f"{day['wind_speed']:.1f} m/s", self.data_processor.format_wind_direction(day['wind_direction_avg']))
-                        st.metric("Humidity", f"{day['humidity']:.0f}%", f"{day['humidity_range']:.0f}% range")
-                    with metric_cols[2]:
-                        st.metric("Pressure", f"{day['pressure_avg']:.0f} hPa", day['pressure_trend'].title())
-                        st.metric("UV Index", f"{day['uv_index_max']:.1f}", "Max Daily")
+            metrics = (
+                ("Temperature", f"{day['temp_avg']:.0f}{symbols['temp']}", f"{day['temp_max']:.0f}° / {day['temp_min']:.0f}°"),
+                ("Wind", f"{day['wind_speed']:.1f} {symbols['speed']}", wind_direction(day['wind_direction_avg'])),
+                ("Pressure", f"{day['pressure_avg']:.0f} hPa", day['pressure_trend'].title()),
+                ("Precipitation", f"{day['precipitation_chance']:.0f}%", f"{day['precipitation_avg']:.1f} mm"),
+                ("Humidity", f"{day['humidity']:.0f}%", f"{day['humidity_range']:.0f}% range"),
+                ("UV Index", f"{day['uv_index_max']:.1f}", "Max Daily")
+            )
+            metrics_html = self.ui.create_metric_grid(metrics, columns=3)
+            today_class = " today" if day['date'].date() == today else ""
+            cards.append(
+                f'<div class="forecast-day{today_class}">'
+                f'<div class="forecast-day-header">'
+                f'<img src="{icon_url(day["icon"])}" loading="lazy" alt="{day["condition"]}">'
+                f'<div><div class="forecast-day-title">{day["day_full"]}, {day["date"].strftime("%b %d")} - {day["condition"]}</div>'
+                f'<div class="forecast-day-comfort">{day["comfort_level"]} Comfort ({day["comfort_score"]:.0f}%)</div></div>'
+                f'</div>'
+                f'{metrics_html}'
+                f'</div>'
+            )
+        st.html(f'<div class="forecast-days">{"".join(cards)}</div>')
 
+    @st.fragment
     def render_radar_view(self):
-        """Render the weather radar view using an embedded map."""
+        """Render the weather radar view using an embedded map; the map is only mounted on request."""
         st.markdown("## 🗺️ Weather Radar")
         if not st.session_state.get('location_data'):
             st.info("Search for a location to view the weather radar.")
             return
+        # The Windy embed boots a full WebGL map, so wait until the user asks for it
+        if not st.session_state.radar_loaded:
+            st.button("🛰️ Load Radar", on_click=st.session_state.update, kwargs={'radar_loaded': True})
+            return
         lat = st.session_state.location_data['lat']
         lon = st.session_state.location_data['lon']
         embed_url = f"https://embed.windy.com/embed2.html?lat={lat}&lon={lon}&zoom=8&level=surface&overlay=radar&menu=&message=&marker=&calendar=now&pressure=&type=map&location=coordinates&detail=&metricWind=m%2Fs&metricTemp=%C2%B0C&radarRange=-1"
-        st.components.v1.html(f'<iframe width="100%" height="600" src="{embed_url}" frameborder="0"></iframe>', height=610)
+        st.components.v1.html(f'<iframe width="100%" height="600" src="{embed_url}" frameborder="0" loading="lazy"></iframe>', height=610)
 
+    @st.fragment
     def render_maps_view(self):
-            """Render various interactive weather map layers."""
+            """Render various interactive weather map layers; switching layers only reruns this fragment."""
             st.markdown("## 🌍 Interactive Weather Maps")
 
             if not st.session_state.get('location_data'):
                 st.info("Search for a location to explore weather maps.")
                 return
 
-            map_layers = {
-                'Temperature': 'temp_new',
-                'Precipitation': 'precipitation_new',
-                'Wind Speed': 'wind_new',
-                'Pressure': 'pressure_new',
-                'Clouds': 'clouds_new'
-            }
-
-            selected_layer_name = st.selectbox("Select Map Layer", list(map_layers.keys()))
-            selected_layer_code = map_layers[selected_layer_name]
+            selected_layer_name = st.selectbox("Select Map Layer", tuple(_MAP_LAYERS))
+            selected_layer_code = _MAP_LAYERS[selected_layer_name]
 
             lat = st.session_state.location_data['lat']
             lon = st.session_state.location_data['lon']
             zoom = 6
 
             # CORRECTED: Convert lat/lon to the correct tile coordinates
-            xtile, ytile = self._get_tile_coords(lat, lon, zoom)
+            xtile, ytile = _tile_coords(lat, lon, zoom)
 
-            # Build the URL with the correct x and y tile values
-            tile_url = f"https://tile.openweathermap.org/map/{selected_layer_code}/{zoom}/{xtile}/{ytile}.png?appid={self.weather_api.api_key}"
-            
             st.markdown(f"#### {selected_layer_name} Map")
-            st.image(tile_url, caption=f"Weather map layer showing {selected_layer_name.lower()}.", use_column_width=True)
+            try:
+                tile = _fetch_tile(self.weather_api, selected_layer_code, zoom, xtile, ytile)
+            except requests.RequestException:
+                st.warning("Could not load this map layer right now. Please try again shortly.")
+            else:
+                st.image(tile, caption=f"Weather map layer showing {selected_layer_name.lower()}.", use_column_width=True)
             st.info("Note: For a fully interactive map experience, integration with a mapping library like Folium or Leaflet is recommended. This view displays the relevant map tile for the selected location.")
 
     def render_analytics_view(self):
@@ -788,62 +989,72 @@ class PremiumWeatherApp:
                 return
 
             forecast_data = st.session_state.processed_forecast_data
-            trends = self.data_processor.calculate_weather_trends_advanced(forecast_data)
+            # Trends are computed once per fetch; fall back for data loaded before that
+            trends = st.session_state.get('weather_trends')
+            if trends is None:
+                trends = self.data_processor.calculate_weather_trends_advanced(forecast_data)
+                st.session_state.weather_trends = trends
 
+            temp_unit = self._unit_symbols()['temp']
             st.markdown("#### Key Trends for the Next 7 Days")
-            cols = st.columns(4)
-            
-            with cols[0]:
-                temp_trend = trends['temperature']['avg_trend']
-                # CORRECTED: Using st.components.v1.html for robust rendering
-                st.components.v1.html(self.ui.create_premium_metric_card("🌡️", "Temperature Trend", temp_trend['direction'].title(), f"{temp_trend['slope']:.1f}°/day"))
-            with cols[1]:
-                pressure_trend = trends['pressure']['trend']
-                # CORRECTED: Using st.components.v1.html for robust rendering
-                st.components.v1.html(self.ui.create_premium_metric_card("💨", "Pressure Trend", pressure_trend['direction'].title(), f"{pressure_trend['slope']:.1f} hPa/day"))
-            with cols[2]:
-                comfort_trend = trends['comfort']['trend']
-                # CORRECTED: Using st.components.v1.html for robust rendering
-                st.components.v1.html(self.ui.create_premium_metric_card("😊", "Comfort Trend", comfort_trend['direction'].title(), f"{comfort_trend['slope']:.1f}%/day"))
-            with cols[3]:
-                change_prob = trends['pressure']['weather_change_likelihood']['probability']
-                # CORRECTED: Using st.components.v1.html for robust rendering
-                st.components.v1.html(self.ui.create_premium_metric_card("🔄", "Change Likelihood", f"{change_prob:.0%}", "Chance of pattern shift"))
-
-            # --- Detailed Analytics Sections --- (This part remains unchanged)
+            temp_trend = trends['temperature']['avg_trend']
+            pressure_trend = trends['pressure']['trend']
+            comfort_trend = trends['comfort']['trend']
+            change_prob = trends['pressure']['weather_change_likelihood']['probability']
+            cards = (
+                ("🌡️", "Temperature Trend", temp_trend['direction'].title(), f"{temp_trend['slope']:.1f}°/day"),
+                ("💨", "Pressure Trend", pressure_trend['direction'].title(), f"{pressure_trend['slope']:.1f} hPa/day"),
+                ("😊", "Comfort Trend", comfort_trend['direction'].title(), f"{comfort_trend['slope']:.1f}%/day"),
+                ("🔄", "Change Likelihood", f"{change_prob:.0%}", "Chance of pattern shift")
+            )
+            # Using st.components.v1.html for robust rendering; one iframe holds all four cards
+            st.components.v1.html(_trend_cards_html(self.ui, cards))
+
+            # --- Detailed Analytics Sections ---
             with st.expander("🌡️ Temperature Deep Dive", expanded=True):
                 temp_analytics = trends['temperature']
-                st.markdown(f"**Volatility:** {temp_analytics['volatility']:.2f}°C (day-to-day fluctuation)")
-                st.markdown(f"**Heat Wave Risk:** {temp_analytics['heat_wave_risk']:.0%}")
-                st.markdown(f"**Cold Snap Risk:** {temp_analytics['cold_snap_risk']:.0%}")
                 diurnal_trend = temp_analytics['diurnal_range_trend']
-                st.markdown(f"**Daily Temp Range Trend:** {diurnal_trend['direction'].title()} ({diurnal_trend['slope']:.2f}°C/day)")
+                st.markdown("\n\n".join((
+                    f"**Volatility:** {temp_analytics['volatility']:.2f}{temp_unit} (day-to-day fluctuation)",
+                    f"**Heat Wave Risk:** {temp_analytics['heat_wave_risk']:.0%}",
+                    f"**Cold Snap Risk:** {temp_analytics['cold_snap_risk']:.0%}",
+                    f"**Daily Temp Range Trend:** {diurnal_trend['direction'].title()} ({diurnal_trend['slope']:.2f}{temp_unit}/day)"
+                )))
 
             with st.expander("😊 Comfort & Activity Forecast", expanded=True):
                 comfort_analytics = trends['comfort']
-                st.markdown(f"**Average Comfort Score:** {comfort_analytics['avg']:.0f}%")
-                st.markdown(f"**Forecast Quality:** {comfort_analytics['forecast_quality']['quality'].title()}")
-                st.markdown("**Optimal Days:**")
-                for day in comfort_analytics['optimal_days']:
-                    st.markdown(f"- **{day['day']}**: Score {day['overall_score']:.0f}/100 ({', '.join(day['reasons'])})")
+                lines = [
+                    f"**Average Comfort Score:** {comfort_analytics['avg']:.0f}%\n",
+                    f"**Forecast Quality:** {comfort_analytics['forecast_quality']['quality'].title()}\n",
+                    "**Optimal Days:**"
+                ]
+                lines.extend(
+                    f"- **{day['day']}**: Score {day['overall_score']:.0f}/100 ({', '.join(day['reasons'])})"
+                    for day in comfort_analytics['optimal_days']
+                )
+                st.markdown("\n".join(lines))
 
+    @st.fragment
     def render_compare_view(self):
-        """Render the location comparison view."""
+        """Render the location comparison view; its inputs only rerun this fragment."""
         st.markdown("## ⚖️ Location Comparison")
         if 'comparison_locations_data' not in st.session_state:
             st.session_state.comparison_locations_data = {}
         new_location_query = st.text_input("Add a location to compare (e.g., 'Paris, FR')")
         if new_location_query:
-            suggestions = self.location_detector.search_location_advanced(new_location_query, limit=1)
+            suggestions = _cached_location_search(self.location_detector, new_location_query, limit=1)
             if suggestions:
                 location_info = suggestions[0]
                 location_key = location_info['display_name']
                 if location_key not in st.session_state.comparison_locations_data:
                     with st.spinner(f"Fetching weather for {location_key}..."):
-                        weather_data = self.weather_api.get_current_weather_enhanced(location_info['lat'], location_info['lon'])
-                        if weather_data:
+                        try:
+                            weather_data = _cached_current_weather(self.weather_api, location_info['lat'], location_info['lon'], 'metric')
+                        except WeatherRequestError as e:
+                            st.error(str(e))
+                        else:
+                            # Stored before the grid below is drawn, so no rerun is needed to show it
                             st.session_state.comparison_locations_data[location_key] = weather_data
-                            st.rerun()
         if not st.session_state.comparison_locations_data:
             st.info("Add one or more locations to start comparing their current weather conditions.")
             return
@@ -853,14 +1064,14 @@ class PremiumWeatherApp:
             with cols[i]:
                 weather = st.session_state.comparison_locations_data[loc_name]
                 st.markdown(f"#### {loc_name}")
-                st.image(f"http://openweathermap.org/img/wn/{weather['weather'][0]['icon']}@2x.png", width=80)
+                st.image(_icon_image(weather['weather'][0]['icon']), width=80)
                 st.metric("Temperature", f"{weather['main']['temp']:.1f}°C", f"Feels like {weather['main']['feels_like']:.1f}°C")
                 st.metric("Condition", weather['weather'][0]['description'].title())
                 st.metric("Wind", f"{weather['wind']['speed']:.1f} m/s", self.data_processor.format_wind_direction(weather['wind'].get('deg')))
                 st.metric("Humidity", f"{weather['main']['humidity']}%")
-                if st.button("Remove", key=f"remove_{loc_name}"):
-                    del st.session_state.comparison_locations_data[loc_name]
-                    st.rerun()
+                # The callback drops the location before the fragment reruns, so one click costs one pass
+                st.button("Remove", key=f"remove_{loc_name}",
+                          on_click=st.session_state.comparison_locations_data.pop, args=(loc_name, None))
 
     def render_alerts_view(self):
         """Render the weather alerts view."""
@@ -871,7 +1082,11 @@ class PremiumWeatherApp:
         with st.spinner("Checking for weather alerts..."):
             lat = st.session_state.location_data['lat']
             lon = st.session_state.location_data['lon']
-            alerts = self.weather_api.get_weather_alerts_advanced(lat, lon)
+            try:
+                alerts = _cached_alerts(self.weather_api, round(lat, 4), round(lon, 4))
+            except WeatherRequestError as e:
+                st.error(str(e))
+                return
         if not alerts:
             st.success("✅ No active weather alerts for the selected location.")
             return
@@ -884,8 +1099,9 @@ class PremiumWeatherApp:
             else:
                 st.info(f"**{alert['event']}** from {alert['sender_name']}")
 
+    @st.fragment
     def render_historical_view(self):
-        """Render the historical weather data view."""
+        """Render the historical weather data view; picking a date only reruns this fragment."""
         st.markdown("## 📈 Historical Data")
         if not st.session_state.get('location_data'):
             st.info("Search for a location to look up historical weather data.")
@@ -914,23 +1130,28 @@ class PremiumWeatherApp:
         st.markdown("#### ⚡ Current Conditions")
         if st.session_state.get('weather_data'):
             weather = st.session_state.weather_data
-            cols = st.columns(2)
-            cols[0].metric("Humidity", f"{weather['main']['humidity']}%")
-            cols[0].metric("Pressure", f"{weather['main']['pressure']} hPa")
-            cols[1].metric("Visibility", f"{weather.get('visibility', 10000) / 1000:.1f} km")
-            cols[1].metric("Cloud Cover", f"{weather['clouds']['all']}%")
+            metrics = (
+                ("Humidity", f"{weather['main']['humidity']}%", ""),
+                ("Visibility", self._weather_derived()['visibility'], ""),
+                ("Pressure", f"{weather['main']['pressure']} hPa", ""),
+                ("Cloud Cover", f"{weather['clouds']['all']}%", "")
+            )
+            st.html(self.ui.create_metric_grid(metrics, columns=2))
         else:
             st.write("No data available.")
 
     def render_hourly_forecast_widget(self):
         """Render a widget with a 24-hour forecast chart."""
         st.markdown("#### 🕒 24-Hour Forecast")
-        if st.session_state.get('hourly_data'):
-            hourly_data = st.session_state.hourly_data[:24]
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=[h['time'] for h in hourly_data], y=[h['temp'] for h in hourly_data], name='Temperature', mode='lines+markers', line=dict(color='var(--primary)')))
-            fig.update_layout(template="plotly_dark", plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)', height=200, margin=dict(l=0, r=0, t=0, b=0), xaxis=dict(showticklabels=False), yaxis=dict(showticklabels=False))
-            st.plotly_chart(fig, use_container_width=True)
+        hourly_df = st.session_state.get('hourly_data')
+        if hourly_df is not None and not hourly_df.empty:
+            # Rows are 3-hourly steps, so bound by time rather than row count
+            hourly_df = hourly_df[hourly_df['time'] <= pd.Timestamp.now() + pd.Timedelta(hours=24)]
+            times = tuple(hourly_df['time'])
+            temps = tuple(hourly_df['temp'].to_numpy())
+            # Bound the points sent to Plotly if the forecast window grows
+            times, temps = self.data_processor.downsample_lttb(times, temps, _MAX_CHART_POINTS)
+            st.plotly_chart(_build_hourly_figure(tuple(times), tuple(temps)), use_container_width=True, config=_SPARKLINE_CONFIG)
         else:
             st.write("No data available.")
 
@@ -939,14 +1160,14 @@ class PremiumWeatherApp:
         st.markdown("#### 🗓️ 7-Day Forecast")
         if st.session_state.get('processed_forecast_data'):
             forecast = st.session_state.processed_forecast_data
-            for day in forecast:
-                cols = st.columns([1, 2, 1])
-                with cols[0]:
-                    st.write(day['day'])
-                with cols[1]:
-                    st.image(f"http://openweathermap.org/img/wn/{day['icon']}.png", width=32)
-                with cols[2]:
-                    st.write(f"{day['temp_max']:.0f}°/{day['temp_min']:.0f}°")
+            # Emit all rows as one grid rather than three elements per day
+            rows = "".join(
+                f'<div>{day["day"]}</div>'
+                f'<div><img src="{icon_url(day["icon"], "")}" width="32" loading="lazy"></div>'
+                f'<div>{day["temp_max"]:.0f}°/{day["temp_min"]:.0f}°</div>'
+                for day in forecast
+            )
+            st.html(f'<div class="weekly-forecast">{rows}</div>')
         else:
             st.write("No data available.")
 
@@ -959,8 +1180,7 @@ class PremiumWeatherApp:
             aqi = aqi_data['main']['aqi']
             level_info = self.weather_api._get_aqi_health_info(aqi)
             level = level_info['level']
-            color_map = {'Good': '#10b981', 'Fair': '#f59e0b', 'Moderate': '#f97316', 'Poor': '#ef4444', 'Very Poor': '#dc2626'}
-            st.markdown(self.ui.create_aqi_indicator(aqi, level, color_map.get(level, '#f97316')), unsafe_allow_html=True)
+            st.html(self.ui.create_aqi_indicator(aqi, level, _AQI_COLORS.get(level, '#f97316')))
         else:
             st.write("No air quality data available.")
 
@@ -968,11 +1188,8 @@ class PremiumWeatherApp:
         """Render a widget for UV index."""
         st.markdown("#### ☀️ UV Index & Solar")
         if st.session_state.get('weather_data'):
-            weather = st.session_state.weather_data
-            sunrise = datetime.fromtimestamp(weather['sys']['sunrise']).strftime('%H:%M')
-            sunset = datetime.fromtimestamp(weather['sys']['sunset']).strftime('%H:%M')
-            st.metric("Sunrise", sunrise)
-            st.metric("Sunset", sunset)
+            derived = self._weather_derived()
+            st.html(self.ui.create_metric_grid((("Sunrise", derived['sunrise'], ""), ("Sunset", derived['sunset'], ""))))
         else:
             st.write("No data available.")
 
@@ -980,11 +1197,9 @@ class PremiumWeatherApp:
         """Render a widget for atmospheric pressure trends."""
         st.markdown("#### 📈 Atmospheric Pressure")
         if st.session_state.get('processed_forecast_data'):
-            pressure_data = [d['pressure_avg'] for d in st.session_state.processed_forecast_data]
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(y=pressure_data, mode='lines', line=dict(color='var(--accent)')))
-            fig.update_layout(template="plotly_dark", plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)', height=150, margin=dict(l=0, r=0, t=0, b=0), xaxis=dict(showticklabels=False), yaxis=dict(showticklabels=False))
-            st.plotly_chart(fig, use_container_width=True)
+            pressure_data = tuple(self._forecast_frame()['pressure_avg'].to_numpy())
+            positions, pressure_data = self.data_processor.downsample_lttb(range(len(pressure_data)), pressure_data, _MAX_CHART_POINTS)
+            st.plotly_chart(_build_pressure_figure(tuple(positions), tuple(pressure_data)), use_container_width=True, config=_SPARKLINE_CONFIG)
         else:
             st.write("No data available.")
 
@@ -993,10 +1208,14 @@ class PremiumWeatherApp:
         st.markdown("#### 💨 Wind Conditions")
         if st.session_state.get('weather_data'):
             wind = st.session_state.weather_data['wind']
-            st.metric("Wind Speed", f"{wind['speed']:.1f} m/s")
-            st.metric("Direction", self.data_processor.format_wind_direction(wind.get('deg')))
+            speed_unit = self._unit_symbols()['speed']
+            metrics = [
+                ("Wind Speed", f"{wind['speed']:.1f} {speed_unit}", ""),
+                ("Direction", self.data_processor.format_wind_direction(wind.get('deg')), "")
+            ]
             if 'gust' in wind:
-                st.metric("Gusts", f"{wind['gust']:.1f} m/s")
+                metrics.append(("Gusts", f"{wind['gust']:.1f} {speed_unit}", ""))
+            st.html(self.ui.create_metric_grid(metrics))
         else:
             st.write("No data available.")
 
@@ -1016,7 +1235,11 @@ class PremiumWeatherApp:
         if st.session_state.get('location_data'):
             lat = st.session_state.location_data['lat']
             lon = st.session_state.location_data['lon']
-            alerts = self.weather_api.get_weather_alerts_advanced(lat, lon)
+            try:
+                alerts = _cached_alerts(self.weather_api, round(lat, 4), round(lon, 4))
+            except WeatherRequestError as e:
+                st.error(str(e))
+                return
             if alerts:
                 for alert in alerts[:1]:
                     st.warning(f"**{alert['event']}**: {alert['description'][:50]}...")
@@ -1026,9 +1249,16 @@ class PremiumWeatherApp:
             st.write("No location selected.")
     
     # Additional methods for other views...
-    def refresh_weather_data(self):
-        """Refresh weather data for current location"""
+    def refresh_weather_data(self, force: bool = False):
+        """Refresh weather data for current location, unless it is already current"""
         if st.session_state.location_data:
+            lat = round(st.session_state.location_data['lat'], 4)
+            lon = round(st.session_state.location_data['lon'], 4)
+            # Same place and units fetched within the refresh interval: nothing new to show
+            if (not force
+                    and st.session_state.last_fetch_key == (lat, lon, st.session_state.units)
+                    and time.time() - st.session_state.last_fetch_ts < st.session_state.refresh_interval):
+                return
             self.fetch_weather_data(
                 st.session_state.location_data['lat'],
                 st.session_state.location_data['lon']
@@ -1043,13 +1273,22 @@ class PremiumWeatherApp:
             else:
                 st.info("Location already in favorites!")
     
+    def set_current_view(self, view_key):
+        """Switch the main content area to another view"""
+        st.session_state.current_view = view_key
+        st.query_params['view'] = view_key
+    
     def handle_quick_location(self, location):
         """Handle quick location selection"""
-        if location == "auto":
-            if self.location_detector.get_location_with_ai_enhancement():
+        if location is None:
+            # IP geolocation is stable for a session, so detect it only once
+            if not st.session_state.detected_location:
+                st.session_state.detected_location = self.location_detector.get_location_with_ai_enhancement()
+            if st.session_state.detected_location:
+                st.session_state.location_data = st.session_state.detected_location
                 self.refresh_weather_data()
         else:
-            location_data = self.location_detector.search_location_advanced(location)
+            location_data = _cached_location_search(self.location_detector, location)
             if location_data:
                 st.session_state.location_data = location_data[0] # Take the first result
                 self.refresh_weather_data()
@@ -1067,39 +1306,73 @@ class PremiumWeatherApp:
     
     def fetch_weather_data(self, lat, lon):
         """Fetch comprehensive weather data"""
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        # Round so that tiny geolocation jitter still hits the cache
+        lat, lon = round(lat, 4), round(lon, 4)
+        status = "☁️ Fetching current conditions, forecast and air quality..."
+        progress_bar = st.progress(0, text=status)
         
         try:
-            status_text.text("☁️ Fetching current conditions...")
-            progress_bar.progress(20)
-            current_weather = self.weather_api.get_current_weather_enhanced(lat, lon, st.session_state.units)
+            units = st.session_state.units
             
-            status_text.text("📅 Loading forecast data...")
-            progress_bar.progress(50)
-            forecast = self.weather_api.get_forecast_enhanced(lat, lon, st.session_state.units)
+            calls = {
+                'current': (_cached_current_weather, self.weather_api, lat, lon, units),
+                'forecast': (_cached_forecast, self.weather_api, lat, lon, units),
+                'air_quality': (_cached_air_quality, self.weather_api, lat, lon)
+            }
+            results = {}
+            # Failures are shown here, outside the cached calls, once per distinct message
+            errors = []
+            if _SERIAL_FETCH:
+                for completed, (name, (fn, *args)) in enumerate(calls.items(), start=1):
+                    try:
+                        results[name] = fn(*args)
+                    except WeatherRequestError as e:
+                        results[name] = None
+                        errors.append(str(e))
+                    progress_bar.progress(int(completed / len(calls) * 90), text=status)
+            else:
+                # The three requests are independent, so run them concurrently. Workers
+                # share this script's run context so cached calls and error messages
+                # behave exactly as they do on the main thread.
+                ctx = get_script_run_ctx()
+                with ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+                    futures = {executor.submit(fn, *args): name for name, (fn, *args) in calls.items()}
+                    for completed, future in enumerate(as_completed(futures), start=1):
+                        try:
+                            results[futures[future]] = future.result()
+                        except WeatherRequestError as e:
+                            results[futures[future]] = None
+                            errors.append(str(e))
+                        progress_bar.progress(int(completed / len(futures) * 90), text=status)
+            
+            for message in dict.fromkeys(errors):
+                st.error(message)
             
-            status_text.text("🌬️ Checking air quality...")
-            progress_bar.progress(80)
-            air_quality = self.weather_api.get_air_quality_enhanced(lat, lon)
+            current_weather = results['current']
+            forecast = results['forecast']
+            air_quality = results['air_quality']
             
             if current_weather:
                 st.session_state.weather_data = current_weather
+                st.session_state.weather_derived = self._derive_weather_fields(current_weather)
+                st.session_state.last_fetch_key = (lat, lon, units)
+                st.session_state.last_fetch_ts = time.time()
             if forecast:
                 st.session_state.forecast_data = forecast
-                st.session_state.processed_forecast_data = self.data_processor.process_forecast_data_advanced(forecast)
+                # A cached forecast yields the same digest, so the processors only run on new data
+                (st.session_state.processed_forecast_data,
+                 st.session_state.forecast_frame,
+                 st.session_state.hourly_data,
+                 st.session_state.weather_trends) = _process_forecast(
+                    self.data_processor, lat, lon, units, _forecast_digest(forecast), forecast
+                )
             if air_quality:
                 st.session_state.air_quality_data = air_quality
             
             st.session_state.last_update = datetime.now()
             
-            status_text.text("✅ All data loaded successfully!")
-            progress_bar.progress(100)
-            time.sleep(0.5)
-            
         finally:
             progress_bar.empty()
-            status_text.empty()
     
     def run(self):
             """Main application runner"""
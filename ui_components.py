@@ -1,10 +1,194 @@
 import streamlit as st
 from typing import Dict, Any, List, Optional
 import json
+import re
 import numpy as np
 from datetime import datetime
-import plotly.graph_objects as go
-import plotly.express as px
+from functools import lru_cache
+import os
+
+# Pure HTML builders shared by every UIComponents instance; the dashboard
+# re-renders the same few icons, AQI levels and metric cards on every rerun.
+@lru_cache(maxsize=256)
+def _animated_icon_html(icon_code: str, condition: str, size: str) -> str:
+    """Build the animated weather icon markup"""
+    condition_class = f"weather-{condition.lower()}"
+    
+    # Advanced icon mapping with special effects
+    special_effects = {
+        'sunny': 'weather-sunny',
+        'clear': 'weather-sunny',
+        'rain': 'weather-rainy',
+        'drizzle': 'weather-rainy',
+        'thunderstorm': 'weather-stormy',
+        'snow': 'weather-snowy',
+        'clouds': 'weather-cloudy',
+        'mist': 'weather-cloudy',
+        'fog': 'weather-cloudy'
+    }
+    
+    effect_class = special_effects.get(condition.lower(), 'weather-clear')
+    
+    return f"""
+    <div class="weather-icon-animated {effect_class}">
+        <img src="{icon_url(icon_code, '4x')}" 
+             style="width: {size}; height: {size};" 
+             alt="{condition}" />
+    </div>
+    """
+
+@lru_cache(maxsize=64)
+def _aqi_indicator_html(aqi: int, level: str, color: str) -> str:
+    """Build the AQI indicator markup"""
+    rgb = _hex_to_rgb(color)
+    return f"""
+    <div class="aqi-indicator-premium" style="
+        background: linear-gradient(135deg, 
+            rgba({rgb}, 0.2), 
+            rgba({rgb}, 0.1)
+        );
+        border: 2px solid rgba({rgb}, 0.3);
+    ">
+        <div class="aqi-value" style="color: {color};">{aqi}</div>
+        <div class="aqi-level" style="color: {color};">{level}</div>
+        <div style="
+            font-size: 0.9rem;
+            margin-top: 0.5rem;
+            opacity: 0.9;
+            color: rgba(255, 255, 255, 0.8);
+        ">Air Quality Index</div>
+    </div>
+    """
+
+# Trend direction -> (icon, colour) for the metric card corner badge
+_METRIC_TRENDS = {
+    'up': ('📈', 'var(--success)'),
+    'down': ('📉', 'var(--error)'),
+    'stable': ('➡️', 'var(--info)')
+}
+
+# Card rules the grid carries with it; it is rendered in an iframe the page stylesheets cannot reach
+_METRIC_CARD_CSS = (
+    '<style>'
+    '.metric-unit { font-size: 0.7em; opacity: 0.8; margin-left: 2px; }'
+    '.metric-description { font-size: 0.75rem; color: rgba(255, 255, 255, 0.5); margin-top: 8px; line-height: 1.3; }'
+    '.metric-trend { position: absolute; top: 12px; right: 12px; font-size: 14px; }'
+    '</style>'
+)
+
+@lru_cache(maxsize=512)
+def _metric_card_html(icon: str, label: str, value: str, unit: str, color: str,
+                      description: str, trend: Optional[str]) -> str:
+    """Build the premium metric card markup; layout comes from the stylesheet, only colours stay inline"""
+    trend_indicator = ""
+    if trend:
+        trend_icon, trend_color = _METRIC_TRENDS.get(trend, _METRIC_TRENDS['stable'])
+        trend_indicator = f'<div class="metric-trend" style="color: {trend_color};">{trend_icon}</div>'
+    description_html = f'<div class="metric-description">{description}</div>' if description else ''
+    return (
+        f'<div class="metric-card-premium interactive-card">{trend_indicator}'
+        f'<div class="metric-icon" style="color: {color};">{icon}</div>'
+        f'<div class="metric-value">{value}<small class="metric-unit">{unit}</small></div>'
+        f'<div class="metric-label">{label}</div>{description_html}</div>'
+    )
+
+@lru_cache(maxsize=128)
+def _gradient_text_html(text: str, gradient: str) -> str:
+    """Build the gradient text markup"""
+    return f"""
+    <span style="
+        background: {gradient};
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+        font-weight: 600;
+    ">{text}</span>
+    """
+
+@lru_cache(maxsize=128)
+def _metric_grid_html(metrics: tuple, columns: int) -> str:
+    """Build a grid of (label, value, delta) metrics"""
+    cells = "".join(
+        f'<div><div class="metric-label">{label}</div><div class="metric-value">{value}</div>'
+        + (f'<div class="metric-delta">{delta}</div>' if delta else '')
+        + '</div>'
+        for label, value, delta in metrics
+    )
+    return f'<div class="metric-grid" style="grid-template-columns: repeat({columns}, 1fr);">{cells}</div>'
+
+@lru_cache(maxsize=16)
+def _hex_to_rgb(hex_color: str) -> str:
+    """Convert hex color to RGB values"""
+    hex_color = hex_color.lstrip('#')
+    return f"{int(hex_color[0:2], 16)}, {int(hex_color[2:4], 16)}, {int(hex_color[4:6], 16)}"
+
+
+# Files under static/ are served by Streamlit at app/static/ (see .streamlit/config.toml)
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# Fonts load through <link> tags rather than a CSS @import, so the browser fetches them in parallel with the stylesheets
+FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@100..900&family=JetBrains+Mono:wght@100..800&family=Playfair+Display:wght@400..900&family=Space+Grotesk:wght@300..700&display=swap">'
+)
+
+# Minification passes; the space before a ':' is kept since ".a ::x" and ".a::x" select different elements
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};,])\s*')
+_CSS_COLON_RE = re.compile(r':\s+')
+
+def _minify_css(css: str) -> str:
+    """Strip comments and the whitespace the browser does not need"""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_SPACE_RE.sub(' ', css)
+    css = _CSS_PUNCT_RE.sub(r'\1', css)
+    return _CSS_COLON_RE.sub(':', css).strip()
+
+@lru_cache(maxsize=None)
+def _read_css(name: str) -> str:
+    """Minified contents of a stylesheet under static/"""
+    with open(os.path.join(_STATIC_DIR, name), encoding="utf-8") as f:
+        return _minify_css(f.read())
+
+def inline_css(name: str) -> str:
+    """Minified stylesheet under static/ wrapped in a <style> tag, resent in full wherever it is emitted"""
+    return f"<style>{_read_css(name)}</style>"
+
+# Runs in a components iframe and adopts the sheet into the app page, which keeps it after the
+# iframe is gone; the flag on the page window makes a repeated injection a no-op
+_STYLESHEET_ADOPTER = """<script>
+(() => {{
+    const page = window.parent;
+    const loaded = page.__climatrackSheets = page.__climatrackSheets || {{}};
+    if (loaded[{name}]) return;
+    const css = {css};
+    if ('adoptedStyleSheets' in page.document) {{
+        const sheet = new page.CSSStyleSheet();
+        sheet.replaceSync(css);
+        page.document.adoptedStyleSheets = [...page.document.adoptedStyleSheets, sheet];
+    }} else {{
+        const style = page.document.createElement('style');
+        style.textContent = css;
+        page.document.head.appendChild(style);
+    }}
+    loaded[{name}] = true;
+}})();
+</script>"""
+
+@lru_cache(maxsize=None)
+def stylesheet_adopter(name: str) -> str:
+    """Script for st.components.v1.html that adds a static/ stylesheet to the app page once per browser window"""
+    def js(value):
+        return json.dumps(value).replace("</", "<\\/")
+    return _STYLESHEET_ADOPTER.format(name=js(name), css=js(_read_css(name)))
+
+def icon_url(code: str, size: str = "2x") -> str:
+    """Weather icon URL on the OpenWeatherMap CDN, always over HTTPS"""
+    name = f"{code}@{size}.png" if size else f"{code}.png"
+    return f"https://openweathermap.org/img/wn/{name}"
+
 
 class UIComponents:
     """World-class UI component library with premium animations and interactions"""
@@ -17,924 +201,31 @@ class UIComponents:
             "bounce": "bounce 2s infinite",
             "pulse": "pulse 2s infinite",
             "float": "float 6s ease-in-out infinite",
-            "glow": "glow 3s ease-in-out infinite",
+            "glow": "glow 3s ease-in-out 1",
             "shimmer": "shimmer 2s linear infinite"
         }
         
     def load_premium_css(self):
         """Load world-class premium CSS with advanced features"""
-        st.markdown("""
-        <style>
-        /* Import Premium Fonts */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@100;200;300;400;500;600;700;800;900&family=JetBrains+Mono:wght@100;200;300;400;500;600;700;800&family=Playfair+Display:wght@400;500;600;700;800;900&family=Space+Grotesk:wght@300;400;500;600;700&display=swap');
-        
-        /* Advanced CSS Custom Properties */
-        :root {
-            /* Color System */
-            --primary: #00d4ff;
-            --primary-rgb: 0, 212, 255;
-            --secondary: #7c3aed;
-            --secondary-rgb: 124, 58, 237;
-            --accent: #06ffa5;
-            --accent-rgb: 6, 255, 165;
-            --warm: #ff6b35;
-            --warm-rgb: 255, 107, 53;
-            --cold: #4facfe;
-            --cold-rgb: 79, 172, 254;
-            
-            /* Status Colors */
-            --success: #10b981;
-            --warning: #f59e0b;
-            --error: #ef4444;
-            --info: #3b82f6;
-            
-            /* Glass Morphism Advanced */
-            --glass-bg: rgba(255, 255, 255, 0.03);
-            --glass-bg-hover: rgba(255, 255, 255, 0.05);
-            --glass-border: rgba(255, 255, 255, 0.08);
-            --glass-border-hover: rgba(255, 255, 255, 0.15);
-            --glass-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-            --glass-shadow-hover: 0 16px 48px rgba(0, 0, 0, 0.4);
-            --glass-backdrop: blur(10px);
-            --glass-backdrop-strong: blur(40px);
-            
-            /* Spacing System (8px base) */
-            --space-xs: 0.25rem;
-            --space-sm: 0.5rem;
-            --space-md: 1rem;
-            --space-lg: 1.5rem;
-            --space-xl: 2rem;
-            --space-2xl: 3rem;
-            --space-3xl: 4rem;
-            --space-4xl: 6rem;
-            --space-5xl: 8rem;
-            
-            /* Border Radius System */
-            --radius-xs: 4px;
-            --radius-sm: 8px;
-            --radius-md: 12px;
-            --radius-lg: 16px;
-            --radius-xl: 20px;
-            --radius-2xl: 24px;
-            --radius-3xl: 32px;
-            --radius-full: 9999px;
-            
-            /* Shadow System */
-            --shadow-xs: 0 1px 2px rgba(0, 0, 0, 0.05);
-            --shadow-sm: 0 1px 3px rgba(0, 0, 0, 0.1);
-            --shadow-md: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-            --shadow-lg: 0 10px 15px -3px rgba(0, 0, 0, 0.1);
-            --shadow-xl: 0 20px 25px -5px rgba(0, 0, 0, 0.1);
-            --shadow-2xl: 0 25px 50px -12px rgba(0, 0, 0, 0.25);
-            --shadow-inner: inset 0 2px 4px rgba(0, 0, 0, 0.06);
-            --shadow-glow: 0 0 20px rgba(var(--primary-rgb), 0.3);
-            --shadow-glow-strong: 0 0 40px rgba(var(--primary-rgb), 0.5);
-            
-            /* Animation Timing */
-            --transition-fast: 150ms cubic-bezier(0.4, 0, 0.2, 1);
-            --transition-normal: 300ms cubic-bezier(0.4, 0, 0.2, 1);
-            --transition-slow: 500ms cubic-bezier(0.4, 0, 0.2, 1);
-            --transition-bounce: 400ms cubic-bezier(0.34, 1.56, 0.64, 1);
-            
-            /* Typography Scale */
-            --text-xs: 0.75rem;
-            --text-sm: 0.875rem;
-            --text-base: 1rem;
-            --text-lg: 1.125rem;
-            --text-xl: 1.25rem;
-            --text-2xl: 1.5rem;
-            --text-3xl: 1.875rem;
-            --text-4xl: 2.25rem;
-            --text-5xl: 3rem;
-            --text-6xl: 3.75rem;
-            --text-7xl: 4.5rem;
-            --text-8xl: 6rem;
-            --text-9xl: 8rem;
-            
-            /* Z-Index Scale */
-            --z-dropdown: 1000;
-            --z-sticky: 1020;
-            --z-fixed: 1030;
-            --z-modal-backdrop: 1040;
-            --z-modal: 1050;
-            --z-popover: 1060;
-            --z-tooltip: 1070;
-            --z-toast: 1080;
-        }
-        
-        /* Advanced Global Styles */
-        .main {
-            /* CORRECTED: The conflicting background property has been removed. */
-            /* The background image from main.py will now be visible. */
-            min-height: 100vh;
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            position: relative;
-            overflow-x: hidden;
-        }
-        
-        .stAppViewBlockContainer {
-            padding-top: var(--space-lg);
-            max-width: none !important;
-        }
-        
-        /* Custom Scrollbar */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
-        
-        ::-webkit-scrollbar-track {
-            background: rgba(0, 0, 0, 0.2);
-            border-radius: var(--radius-full);
-        }
-        
-        ::-webkit-scrollbar-thumb {
-            background: linear-gradient(180deg, var(--primary), var(--secondary));
-            border-radius: var(--radius-full);
-            transition: var(--transition-normal);
-        }
-        
-        ::-webkit-scrollbar-thumb:hover {
-            background: linear-gradient(180deg, var(--accent), var(--primary));
-            box-shadow: var(--shadow-glow);
-        }
-        
-        /* Advanced Animations */
-        @keyframes sparkle {
-            0% { transform: translateY(0px); }
-            100% { transform: translateY(-100px); }
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        @keyframes slideUp {
-            from { opacity: 0; transform: translateY(30px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        @keyframes scaleIn {
-            from { opacity: 0; transform: scale(0.8); }
-            to { opacity: 1; transform: scale(1); }
-        }
-        
-        @keyframes bounce {
-            0%, 20%, 53%, 80%, 100% { transform: translate3d(0,0,0); }
-            40%, 43% { transform: translate3d(0, -30px, 0); }
-            70% { transform: translate3d(0, -15px, 0); }
-            90% { transform: translate3d(0, -4px, 0); }
-        }
-        
-        @keyframes pulse {
-            0%, 100% { opacity: 1; transform: scale(1); }
-            50% { opacity: 0.7; transform: scale(1.05); }
-        }
-        
-        @keyframes float {
-            0%, 100% { transform: translateY(0px); }
-            50% { transform: translateY(-10px); }
-        }
-        
-        @keyframes glow {
-            0%, 100% { 
-                box-shadow: 0 0 20px rgba(var(--primary-rgb), 0.3);
-                filter: brightness(1);
-            }
-            50% { 
-                box-shadow: 0 0 40px rgba(var(--primary-rgb), 0.6);
-                filter: brightness(1.1);
-            }
-        }
-        
-        @keyframes shimmer {
-            0% { transform: translateX(-100%); }
-            100% { transform: translateX(100%); }
-        }
-        
-        @keyframes gradientShift {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-        
-        @keyframes rotate {
-            from { transform: rotate(0deg); }
-            to { transform: rotate(360deg); }
-        }
-        
-        @keyframes morphBackground {
-            0%, 100% { border-radius: var(--radius-xl); }
-            50% { border-radius: var(--radius-3xl); }
-        }
-        
-        /* Premium Glass Cards */
-        .glass-card {
-            background: var(--glass-bg);
-            backdrop-filter: var(--glass-backdrop);
-            border: 1px solid var(--glass-border);
-            border-radius: var(--radius-xl);
-            box-shadow: var(--glass-shadow);
-            transition: var(--transition-normal);
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .glass-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.1), transparent);
-            transition: var(--transition-slow);
-        }
-        
-        .glass-card:hover {
-            background: var(--glass-bg-hover);
-            border-color: var(--glass-border-hover);
-            box-shadow: var(--glass-shadow-hover);
-            transform: translateY(-4px);
-        }
-        
-        .glass-card:hover::before {
-            left: 100%;
-        }
-        
-        /* Interactive Elements */
-        .interactive-card {
-            transition: var(--transition-normal);
-            cursor: pointer;
-            position: relative;
-            transform-style: preserve-3d;
-        }
-        
-        .interactive-card:hover {
-            transform: perspective(1000px) rotateX(2deg) translateY(-8px);
-        }
-        
-        .interactive-card:active {
-            transform: perspective(1000px) rotateX(0deg) translateY(-2px);
-        }
-        
-        /* Premium Buttons */
-        .premium-button {
-            background: linear-gradient(135deg, var(--primary), var(--secondary));
-            border: none;
-            border-radius: var(--radius-lg);
-            color: white;
-            font-weight: 600;
-            padding: var(--space-md) var(--space-xl);
-            font-size: var(--text-base);
-            cursor: pointer;
-            transition: var(--transition-normal);
-            position: relative;
-            overflow: hidden;
-            text-decoration: none;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            gap: var(--space-sm);
-            box-shadow: var(--shadow-lg);
-        }
-        
-        .premium-button::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.2), transparent);
-            transition: var(--transition-normal);
-        }
-        
-        .premium-button:hover {
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-xl), var(--shadow-glow);
-            background: linear-gradient(135deg, var(--accent), var(--primary));
-        }
-        
-        .premium-button:hover::before {
-            left: 100%;
-        }
-        
-        .premium-button:active {
-            transform: translateY(0px);
-        }
-        
-        /* Premium Input Fields */
-        .premium-input {
-            width: 100%;
-            padding: var(--space-md) var(--space-lg);
-            background: var(--glass-bg);
-            border: 2px solid var(--glass-border);
-            border-radius: var(--radius-lg);
-            color: white;
-            font-size: var(--text-base);
-            font-family: 'Inter', sans-serif;
-            transition: var(--transition-normal);
-            backdrop-filter: var(--glass-backdrop);
-        }
-        
-        .premium-input:focus {
-            background: var(--glass-bg-hover);
-            border-color: var(--primary);
-            box-shadow: 0 0 0 4px rgba(var(--primary-rgb), 0.1);
-            outline: none;
-            transform: translateY(-1px);
-        }
-        
-        .premium-input::placeholder {
-            color: rgba(255, 255, 255, 0.5);
-            font-weight: 300;
-        }
-        
-        /* Weather Display Components */
-        .weather-hero {
-            background: linear-gradient(135deg, 
-                rgba(var(--primary-rgb), 0.1), 
-                rgba(var(--secondary-rgb), 0.1)
-            );
-            border-radius: var(--radius-2xl);
-            padding: var(--space-3xl);
-            border: 1px solid var(--glass-border);
-            backdrop-filter: var(--glass-backdrop);
-            position: relative;
-            overflow: hidden;
-            animation: fadeIn 0.8s ease-out;
-        }
-        
-        .weather-hero::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 3px;
-            background: linear-gradient(90deg, var(--primary), var(--accent), var(--secondary));
-            background-size: 200% 100%;
-            animation: gradientShift 4s ease-in-out infinite;
-        }
-        
-        .weather-icon-animated {
-            position: relative;
-            display: inline-block;
-            animation: float 6s ease-in-out infinite;
-        }
-        
-        .weather-icon-animated img {
-            width: 120px;
-            height: 120px;
-            filter: drop-shadow(0 0 20px rgba(255, 255, 255, 0.3));
-            transition: var(--transition-normal);
-        }
-        
-        .weather-icon-animated:hover img {
-            transform: scale(1.1);
-            filter: drop-shadow(0 0 30px rgba(255, 255, 255, 0.5));
-        }
-        
-        /* Temperature Display */
-        .temperature-display {
-            font-family: 'Space Grotesk', sans-serif;
-            font-size: clamp(3rem, 8vw, 6rem);
-            font-weight: 800;
-            background: linear-gradient(135deg, #ffffff, #e2e8f0);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            text-align: center;
-            line-height: 0.9;
-            margin: var(--space-md) 0;
-            position: relative;
-        }
-        
-        .temperature-display::after {
-            content: '';
-            position: absolute;
-            bottom: -10px;
-            left: 50%;
-            transform: translateX(-50%);
-            width: 60px;
-            height: 3px;
-            background: linear-gradient(90deg, var(--primary), var(--accent));
-            border-radius: var(--radius-full);
-            animation: shimmer 2s linear infinite;
-        }
-        
-        /* Metric Cards */
-        .metric-card-premium {
-            background: var(--glass-bg);
-            backdrop-filter: var(--glass-backdrop);
-            border: 1px solid var(--glass-border);
-            border-radius: var(--radius-lg);
-            padding: var(--space-lg);
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-            transition: var(--transition-normal);
-            animation: slideUp 0.5s ease-out;
-        }
-        
-        .metric-card-premium::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 2px;
-            background: linear-gradient(90deg, var(--primary), var(--accent));
-            transform: scaleX(0);
-            transform-origin: left;
-            transition: var(--transition-normal);
-        }
-        
-        .metric-card-premium:hover::before {
-            transform: scaleX(1);
-        }
-        
-        .metric-card-premium:hover {
-            background: var(--glass-bg-hover);
-            border-color: var(--glass-border-hover);
-            transform: translateY(-4px);
-            box-shadow: var(--shadow-xl);
-        }
-        
-        .metric-icon {
-            font-size: var(--text-3xl);
-            margin-bottom: var(--space-md);
-            display: block;
-            filter: drop-shadow(0 0 8px rgba(255, 255, 255, 0.3));
-            animation: pulse 3s infinite;
-        }
-        
-        .metric-value {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: var(--text-2xl);
-            font-weight: 700;
-            color: white;
-            margin-bottom: var(--space-sm);
-            position: relative;
-        }
-        
-        .metric-label {
-            font-size: var(--text-sm);
-            color: rgba(255, 255, 255, 0.7);
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            font-weight: 500;
-        }
-        
-        /* Forecast Cards */
-        .forecast-card-premium {
-            background: var(--glass-bg);
-            backdrop-filter: var(--glass-backdrop);
-            border: 1px solid var(--glass-border);
-            border-radius: var(--radius-lg);
-            padding: var(--space-lg);
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-            transition: var(--transition-normal);
-            cursor: pointer;
-        }
-        
-        .forecast-card-premium::before {
-            content: '';
-            position: absolute;
-            top: -100%;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(180deg, 
-                rgba(var(--primary-rgb), 0.2), 
-                transparent
-            );
-            transition: var(--transition-slow);
-        }
-        
-        .forecast-card-premium:hover {
-            transform: translateY(-8px) scale(1.02);
-            box-shadow: var(--shadow-2xl), var(--shadow-glow);
-            border-color: var(--primary);
-        }
-        
-        .forecast-card-premium:hover::before {
-            top: 0;
-        }
-        
-        .forecast-day {
-            font-size: var(--text-lg);
-            font-weight: 600;
-            color: white;
-            margin-bottom: var(--space-md);
-        }
-        
-        .forecast-icon img {
-            width: 64px;
-            height: 64px;
-            margin: var(--space-sm) 0;
-            filter: drop-shadow(0 0 15px rgba(255, 255, 255, 0.2));
-            transition: var(--transition-normal);
-        }
-        
-        .forecast-card-premium:hover .forecast-icon img {
-            transform: scale(1.15) rotate(5deg);
-            filter: drop-shadow(0 0 25px rgba(255, 255, 255, 0.4));
-        }
-        
-        .forecast-temps {
-            margin: var(--space-md) 0;
-            display: flex;
-            justify-content: center;
-            gap: var(--space-sm);
-            align-items: center;
-        }
-        
-        .temp-high {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: var(--text-xl);
-            font-weight: 700;
-            color: var(--warm);
-        }
-        
-        .temp-low {
-            font-family: 'JetBrains Mono', monospace;
-            font-size: var(--text-lg);
-            font-weight: 500;
-            color: var(--cold);
-        }
-        
-        /* Air Quality Display */
-        .aqi-indicator-premium {
-            position: relative;
-            border-radius: var(--radius-lg);
-            padding: var(--space-xl);
-            text-align: center;
-            color: white;
-            font-weight: bold;
-            overflow: hidden;
-            background: linear-gradient(135deg, 
-                rgba(var(--primary-rgb), 0.2), 
-                rgba(var(--secondary-rgb), 0.2)
-            );
-            backdrop-filter: var(--glass-backdrop);
-            border: 1px solid var(--glass-border);
-        }
-        
-        .aqi-indicator-premium::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(45deg, 
-                transparent, 
-                rgba(255, 255, 255, 0.1), 
-                transparent
-            );
-            animation: shimmer 3s linear infinite;
-        }
-        
-        .aqi-value {
-            font-family: 'Space Grotesk', sans-serif;
-            font-size: var(--text-5xl);
-            font-weight: 800;
-            margin-bottom: var(--space-sm);
-            position: relative;
-            z-index: 1;
-            animation: scaleIn 0.8s ease-out;
-        }
-        
-        .aqi-level {
-            font-size: var(--text-xl);
-            font-weight: 500;
-            position: relative;
-            z-index: 1;
-            text-transform: uppercase;
-            letter-spacing: 2px;
-        }
-        
-        /* Chart Containers */
-        .chart-container-premium {
-            background: var(--glass-bg);
-            backdrop-filter: var(--glass-backdrop);
-            border: 1px solid var(--glass-border);
-            border-radius: var(--radius-xl);
-            padding: var(--space-xl);
-            margin: var(--space-lg) 0;
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .chart-container-premium::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 2px;
-            background: linear-gradient(90deg, var(--primary), var(--accent), var(--secondary));
-            background-size: 200% 100%;
-            animation: gradientShift 3s ease-in-out infinite;
-        }
-        
-        /* Loading States */
-        .loading-skeleton {
-            background: linear-gradient(90deg, 
-                rgba(255, 255, 255, 0.1) 0%, 
-                rgba(255, 255, 255, 0.2) 50%, 
-                rgba(255, 255, 255, 0.1) 100%
-            );
-            background-size: 200% 100%;
-            animation: skeleton-loading 1.5s infinite;
-            border-radius: var(--radius-md);
-        }
-        
-        @keyframes skeleton-loading {
-            0% { background-position: 200% 0; }
-            100% { background-position: -200% 0; }
-        }
-        
-        .loading-spinner {
-            width: 40px;
-            height: 40px;
-            border: 3px solid rgba(255, 255, 255, 0.1);
-            border-top-color: var(--primary);
-            border-radius: 50%;
-            animation: rotate 1s linear infinite;
-            margin: var(--space-lg) auto;
-        }
-        
-        /* Status Indicators */
-        .status-dot {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            display: inline-block;
-            margin-right: var(--space-sm);
-        }
-        
-        .status-online { background: var(--success); animation: pulse 2s infinite; }
-        .status-loading { background: var(--warning); animation: pulse 1s infinite; }
-        .status-error { background: var(--error); animation: pulse 0.5s infinite; }
-        
-        /* Notification Toasts */
-        .toast-notification {
-            position: fixed;
-            top: var(--space-lg);
-            right: var(--space-lg);
-            background: var(--glass-bg);
-            backdrop-filter: var(--glass-backdrop-strong);
-            border: 1px solid var(--glass-border);
-            border-radius: var(--radius-lg);
-            padding: var(--space-lg);
-            color: white;
-            z-index: var(--z-toast);
-            max-width: 400px;
-            box-shadow: var(--shadow-2xl);
-            animation: slideUp 0.3s ease-out;
-        }
-        
-        .toast-success { border-left: 4px solid var(--success); }
-        .toast-warning { border-left: 4px solid var(--warning); }
-        .toast-error { border-left: 4px solid var(--error); }
-        .toast-info { border-left: 4px solid var(--info); }
-        
-        /* Modal Overlays */
-        .modal-overlay {
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.7);
-            backdrop-filter: blur(5px);
-            z-index: var(--z-modal-backdrop);
-            animation: fadeIn 0.3s ease-out;
-        }
-        
-        .modal-content {
-            position: fixed;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            background: var(--glass-bg);
-            backdrop-filter: var(--glass-backdrop-strong);
-            border: 1px solid var(--glass-border);
-            border-radius: var(--radius-xl);
-            padding: var(--space-2xl);
-            z-index: var(--z-modal);
-            max-width: 90vw;
-            max-height: 90vh;
-            overflow-y: auto;
-            animation: scaleIn 0.3s cubic-bezier(0.34, 1.56, 0.64, 1);
-        }
-        
-        /* Weather Condition Specific Animations */
-        .weather-sunny {
-            animation: glow 3s ease-in-out infinite;
-            filter: drop-shadow(0 0 20px rgba(255, 193, 7, 0.4));
-        }
-        
-        .weather-rainy {
-            animation: float 2s ease-in-out infinite;
-            filter: drop-shadow(0 0 15px rgba(59, 130, 246, 0.4));
-        }
-        
-        .weather-snowy {
-            animation: float 3s ease-in-out infinite reverse;
-            filter: drop-shadow(0 0 20px rgba(229, 231, 235, 0.4));
-        }
-        
-        .weather-cloudy {
-            animation: float 4s ease-in-out infinite;
-            filter: drop-shadow(0 0 10px rgba(156, 163, 175, 0.4));
-        }
-        
-        .weather-stormy {
-            animation: pulse 1s ease-in-out infinite;
-            filter: drop-shadow(0 0 25px rgba(239, 68, 68, 0.4));
-        }
-        
-        /* Responsive Design */
-        @media (max-width: 1024px) {
-            :root {
-                --space-xs: 0.2rem;
-                --space-sm: 0.4rem;
-                --space-md: 0.8rem;
-                --space-lg: 1.2rem;
-                --space-xl: 1.6rem;
-                --space-2xl: 2.4rem;
-                --space-3xl: 3.2rem;
-            }
-            
-            .weather-hero {
-                padding: var(--space-2xl);
-            }
-            
-            .temperature-display {
-                font-size: clamp(2.5rem, 6vw, 4rem);
-            }
-        }
-        
-        @media (max-width: 768px) {
-            .metric-card-premium {
-                padding: var(--space-md);
-            }
-            
-            .forecast-card-premium {
-                padding: var(--space-md);
-            }
-            
-            .chart-container-premium {
-                padding: var(--space-lg);
-            }
-            
-            .modal-content {
-                margin: var(--space-lg);
-                padding: var(--space-xl);
-            }
-            
-            .toast-notification {
-                top: var(--space-md);
-                right: var(--space-md);
-                left: var(--space-md);
-                max-width: none;
-            }
-        }
-        
-        @media (max-width: 480px) {
-            .weather-hero {
-                padding: var(--space-xl);
-            }
-            
-            .temperature-display {
-                font-size: clamp(2rem, 8vw, 3rem);
-            }
-            
-            .metric-icon {
-                font-size: var(--text-2xl);
-            }
-            
-            .metric-value {
-                font-size: var(--text-xl);
-            }
-        }
-        
-        /* Accessibility Enhancements */
-        @media (prefers-reduced-motion: reduce) {
-            *, *::before, *::after {
-                animation-duration: 0.01ms !important;
-                animation-iteration-count: 1 !important;
-                transition-duration: 0.01ms !important;
-            }
-        }
-        
-        /* Dark Mode Support */
-        @media (prefers-color-scheme: light) {
-            :root {
-                --glass-bg: rgba(0, 0, 0, 0.03);
-                --glass-bg-hover: rgba(0, 0, 0, 0.05);
-                --glass-border: rgba(0, 0, 0, 0.08);
-                --glass-border-hover: rgba(0, 0, 0, 0.15);
-            }
-        }
-        
-        /* High Contrast Mode */
-        @media (prefers-contrast: high) {
-            :root {
-                --glass-border: rgba(255, 255, 255, 0.3);
-                --glass-border-hover: rgba(255, 255, 255, 0.5);
-            }
-        }
-        
-        /* Print Styles */
-        @media print {
-            .glass-card, .metric-card-premium, .forecast-card-premium {
-                background: white !important;
-                color: black !important;
-                border: 1px solid #ccc !important;
-                box-shadow: none !important;
-            }
-            
-            .temperature-display {
-                color: black !important;
-                -webkit-text-fill-color: black !important;
-            }
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        # The app styles itself through load_premium_styling; this sheet's theme values differ from the page's
+        st.markdown(FONT_LINKS, unsafe_allow_html=True)
+        # A bare <style> block needs no markdown parsing
+        st.html(inline_css("components.css"))
     
     def create_animated_weather_icon(self, icon_code: str, condition: str = "clear", size: str = "120px") -> str:
         """Create advanced animated weather icon with condition-specific effects"""
-        condition_class = f"weather-{condition.lower()}"
-        
-        # Advanced icon mapping with special effects
-        special_effects = {
-            'sunny': 'weather-sunny',
-            'clear': 'weather-sunny',
-            'rain': 'weather-rainy',
-            'drizzle': 'weather-rainy',
-            'thunderstorm': 'weather-stormy',
-            'snow': 'weather-snowy',
-            'clouds': 'weather-cloudy',
-            'mist': 'weather-cloudy',
-            'fog': 'weather-cloudy'
-        }
-        
-        effect_class = special_effects.get(condition.lower(), 'weather-clear')
-        
-        return f"""
-        <div class="weather-icon-animated {effect_class}">
-            <img src="http://openweathermap.org/img/wn/{icon_code}@4x.png" 
-                 style="width: {size}; height: {size};" 
-                 alt="{condition}" />
-        </div>
-        """
+        return _animated_icon_html(icon_code, condition, size)
     
     def create_premium_metric_card(self, icon: str, label: str, value: str, unit: str = "", 
                                  color: str = "var(--primary)", description: str = "", 
                                  trend: str = None) -> str:
         """Create premium metric card with trend indicators and descriptions"""
-        
-        trend_indicator = ""
-        if trend:
-            trend_icons = {
-                'up': '📈',
-                'down': '📉',
-                'stable': '➡️'
-            }
-            trend_colors = {
-                'up': 'var(--success)',
-                'down': 'var(--error)',
-                'stable': 'var(--info)'
-            }
-            trend_indicator = f"""
-                <div style="
-                    position: absolute;
-                    top: 12px;
-                    right: 12px;
-                    font-size: 14px;
-                    color: {trend_colors.get(trend, 'var(--info)')};
-                ">{trend_icons.get(trend, '➡️')}</div>
-            """
-        
-        return f"""
-        <div class="metric-card-premium interactive-card">
-            {trend_indicator}
-            <div class="metric-icon" style="color: {color};">{icon}</div>
-            <div class="metric-value">
-                {value}
-                <small style="font-size: 0.7em; opacity: 0.8; margin-left: 2px;">{unit}</small>
-            </div>
-            <div class="metric-label">{label}</div>
-            {f'<div style="font-size: 0.75rem; color: rgba(255, 255, 255, 0.5); margin-top: 8px; line-height: 1.3;">{description}</div>' if description else ''}
-        </div>
-        """
+        return _metric_card_html(icon, label, value, unit, color, description, trend)
+    
+    def create_metric_card_grid(self, cards, columns: int = 4) -> str:
+        """Create a grid of premium metric cards as one HTML block, one tuple of card arguments per card"""
+        cards_html = "".join(self.create_premium_metric_card(*card) for card in cards)
+        return f'{_METRIC_CARD_CSS}<div style="display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 1rem;">{cards_html}</div>'
     
     def create_premium_forecast_card(self, day_data: Dict, is_today: bool = False) -> str:
         """Create premium forecast card with enhanced styling and interactions"""
@@ -955,7 +246,7 @@ class UIComponents:
             </div>
             
             <div class="forecast-icon">
-                <img src="http://openweathermap.org/img/wn/{day_data.get('icon', '01d')}@2x.png" />
+                <img src="{icon_url(day_data.get('icon', '01d'))}" loading="lazy" />
             </div>
             
             <div class="forecast-temps">
@@ -1001,29 +292,15 @@ class UIComponents:
     
     def create_aqi_indicator(self, aqi: int, level: str, color: str) -> str:
         """Create premium AQI indicator with enhanced visuals"""
-        return f"""
-        <div class="aqi-indicator-premium" style="
-            background: linear-gradient(135deg, 
-                rgba({self._hex_to_rgb(color)}, 0.2), 
-                rgba({self._hex_to_rgb(color)}, 0.1)
-            );
-            border: 2px solid rgba({self._hex_to_rgb(color)}, 0.3);
-        ">
-            <div class="aqi-value" style="color: {color};">{aqi}</div>
-            <div class="aqi-level" style="color: {color};">{level}</div>
-            <div style="
-                font-size: 0.9rem;
-                margin-top: 0.5rem;
-                opacity: 0.9;
-                color: rgba(255, 255, 255, 0.8);
-            ">Air Quality Index</div>
-        </div>
-        """
+        return _aqi_indicator_html(aqi, level, color)
+    
+    def create_metric_grid(self, metrics, columns: int = 1) -> str:
+        """Create a compact grid of (label, value, delta) metrics as one HTML block"""
+        return _metric_grid_html(tuple(metrics), columns)
     
     def _hex_to_rgb(self, hex_color: str) -> str:
         """Convert hex color to RGB values"""
-        hex_color = hex_color.lstrip('#')
-        return f"{int(hex_color[0:2], 16)}, {int(hex_color[2:4], 16)}, {int(hex_color[4:6], 16)}"
+        return _hex_to_rgb(hex_color)
     
     def create_loading_skeleton(self, height: str = "100px", width: str = "100%") -> str:
         """Create advanced loading skeleton with shimmer effect"""
@@ -1050,15 +327,7 @@ class UIComponents:
     
     def create_gradient_text(self, text: str, gradient: str = "linear-gradient(135deg, var(--primary), var(--accent))") -> str:
         """Create gradient text with premium styling"""
-        return f"""
-        <span style="
-            background: {gradient};
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            font-weight: 600;
-        ">{text}</span>
-        """
+        return _gradient_text_html(text, gradient)
     
     def create_notification_toast(self, message: str, type: str = "info", duration: int = 5000) -> str:
         """Create premium notification toast"""
@@ -1129,9 +398,7 @@ class UIComponents:
     
     def create_weather_comparison_grid(self, locations: List[Dict]) -> str:
         """Create premium weather comparison grid"""
-        cards_html = ""
-        for location in locations:
-            cards_html += f"""
+        cards_html = "".join(f"""
             <div class="glass-card interactive-card" style="padding: var(--space-lg); text-align: center;">
                 <h4 style="color: white; margin-bottom: var(--space-md);">{location.get('city', 'Unknown')}</h4>
                 <div style="
@@ -1158,7 +425,7 @@ class UIComponents:
                     <span>🌬️ {location.get('wind', 0)} m/s</span>
                 </div>
             </div>
-            """
+            """ for location in locations)
         
         return f"""
         <div style="
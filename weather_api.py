@@ -5,11 +5,58 @@ import json
 import time
 from datetime import datetime, timedelta
 import hashlib
+import threading
 import asyncio
-import aiohttp
 from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
+# Health guidance per OpenWeatherMap AQI level (1-5)
+_AQI_HEALTH_INFO = {
+    1: {
+        'level': 'Good',
+        'description': 'Air quality is satisfactory',
+        'recommendations': ['Perfect for outdoor activities', 'No health precautions needed'],
+        'sensitive_groups': 'No restrictions'
+    },
+    2: {
+        'level': 'Fair',
+        'description': 'Air quality is acceptable',
+        'recommendations': ['Outdoor activities are generally safe', 'Sensitive individuals should be aware'],
+        'sensitive_groups': 'Very sensitive people might experience minor issues'
+    },
+    3: {
+        'level': 'Moderate',
+        'description': 'Sensitive groups may experience health effects',
+        'recommendations': ['Reduce outdoor activities if you feel symptoms', 'Limit prolonged outdoor exertion'],
+        'sensitive_groups': 'People with respiratory conditions should reduce outdoor activities'
+    },
+    4: {
+        'level': 'Poor',
+        'description': 'Health effects may be experienced by general population',
+        'recommendations': ['Limit outdoor activities', 'Wear a mask when outdoors', 'Keep windows closed'],
+        'sensitive_groups': 'Avoid outdoor activities'
+    },
+    5: {
+        'level': 'Very Poor',
+        'description': 'Health warnings of emergency conditions',
+        'recommendations': ['Avoid outdoor activities', 'Stay indoors', 'Use air purifiers if available'],
+        'sensitive_groups': 'Stay indoors and avoid any outdoor activities'
+    }
+}
+
+# WHO air quality guidelines (µg/m³)
+_WHO_GUIDELINES = {
+    'pm2_5': {'good': 15, 'moderate': 35, 'poor': 75},
+    'pm10': {'good': 45, 'moderate': 100, 'poor': 150},
+    'no2': {'good': 40, 'moderate': 100, 'poor': 200},
+    'o3': {'good': 100, 'moderate': 180, 'poor': 240},
+    'so2': {'good': 20, 'moderate': 80, 'poor': 250}
+}
+
+class WeatherRequestError(Exception):
+    """A weather request that returned no data; the message is ready to show to the user"""
+
+
 class PremiumWeatherAPI:
     """Premium weather API handler with advanced caching, rate limiting, and enhanced features"""
     
@@ -58,6 +105,11 @@ class PremiumWeatherAPI:
             'response_times': []
         }
         
+        # Why the last request on each thread failed; read back by callers that render it themselves
+        self._local = threading.local()
+        # Guards the counters, burst window and cache above; the dashboard fetches on worker threads
+        self._lock = threading.Lock()
+        
         # Quality metrics
         self.data_quality_thresholds = {
             'temperature_range': (-50, 60),  # Reasonable temperature range
@@ -119,28 +171,29 @@ class PremiumWeatherAPI:
             **Note:** It may take up to 2 hours for new API keys to activate.
             """)
     
-    def _implement_rate_limiting(self):
-        """Advanced rate limiting with burst protection"""
-        current_time = time.time()
-        
-        # Remove old entries from burst window
-        self.burst_window = [req_time for req_time in self.burst_window 
-                           if current_time - req_time < 60]
-        
-        # Check burst limit
-        if len(self.burst_window) >= self.burst_limit:
-            sleep_time = 60 - (current_time - self.burst_window[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-        
-        # Check minimum delay between requests
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
-        
-        # Update tracking
-        self.burst_window.append(current_time)
-        self.last_request_time = time.time()
+    def _implement_rate_limiting(self) -> bool:
+        """Advanced rate limiting with burst protection; returns False when the request should be skipped"""
+        # Held across the short delay so concurrent requests are spaced one after another
+        with self._lock:
+            current_time = time.time()
+            
+            # Remove old entries from burst window
+            self.burst_window = [req_time for req_time in self.burst_window 
+                               if current_time - req_time < 60]
+            
+            # Over the burst limit: skip rather than block the script thread for up to a minute
+            if len(self.burst_window) >= self.burst_limit:
+                return False
+            
+            # Check minimum delay between requests
+            time_since_last = current_time - self.last_request_time
+            if time_since_last < self.rate_limit_delay:
+                time.sleep(self.rate_limit_delay - time_since_last)
+            
+            # Update tracking
+            self.burst_window.append(current_time)
+            self.last_request_time = time.time()
+            return True
     
     def _get_cache_key(self, url: str, params: Dict) -> str:
         """Generate cache key with parameter normalization"""
@@ -190,20 +243,36 @@ class PremiumWeatherAPI:
         
         return len(issues) == 0, issues
     
+    @property
+    def last_error(self) -> Optional[str]:
+        """Message for the most recent failed request made on this thread"""
+        return getattr(self._local, 'last_error', None)
+    
+    def _record_failure(self, error_key: str):
+        """Count a failed request under its error type"""
+        with self._lock:
+            self.request_stats['failed_requests'] += 1
+            self.request_stats['api_errors'][error_key] = \
+                self.request_stats['api_errors'].get(error_key, 0) + 1
+    
+    def _request_failed(self, message: str) -> None:
+        """Record why a request returned no data"""
+        self._local.last_error = message
+        return None
+    
     def _make_request_with_analytics(self, url: str, params: Dict, 
                                    cache_type: str = 'current', 
                                    use_cache: bool = True) -> Optional[Dict]:
-        """Enhanced HTTP request with comprehensive analytics and error handling"""
+        """Enhanced HTTP request with comprehensive analytics and error handling; on failure returns None and sets last_error"""
+        self._local.last_error = None
         
         # Validate API key
         if self.api_key == "YOUR_API_KEY_HERE":
-            st.error("❌ Please configure your OpenWeatherMap API key")
-            return None
+            return self._request_failed("❌ Please configure your OpenWeatherMap API key")
         
         # Check daily rate limit
         if self.request_count >= self.daily_limit:
-            st.error("❌ Daily API request limit reached")
-            return None
+            return self._request_failed("❌ Daily API request limit reached")
         
         # Prepare parameters
         params = params.copy()
@@ -211,14 +280,15 @@ class PremiumWeatherAPI:
         
         # Check cache first
         cache_key = self._get_cache_key(url, params)
-        if use_cache and cache_key in self.cache:
-            cache_entry = self.cache[cache_key]
-            if self._is_cache_valid(cache_entry, cache_type):
+        cache_entry = self.cache.get(cache_key) if use_cache else None
+        if cache_entry and self._is_cache_valid(cache_entry, cache_type):
+            with self._lock:
                 self.request_stats['cache_hits'] += 1
-                return cache_entry['data']
+            return cache_entry['data']
         
         # Implement rate limiting
-        self._implement_rate_limiting()
+        if not self._implement_rate_limiting():
+            return self._request_failed("⚠️ Too many requests in the last minute. Please try again shortly.")
         
         # Track request start time
         start_time = time.time()
@@ -229,14 +299,15 @@ class PremiumWeatherAPI:
             response_time = time.time() - start_time
             
             # Update analytics
-            self.request_count += 1
-            self.request_stats['total_requests'] += 1
-            self.request_stats['response_times'].append(response_time)
-            
-            # Calculate average response time
-            if len(self.request_stats['response_times']) > 100:
-                self.request_stats['response_times'] = self.request_stats['response_times'][-100:]
-            self.request_stats['average_response_time'] = np.mean(self.request_stats['response_times'])
+            with self._lock:
+                self.request_count += 1
+                self.request_stats['total_requests'] += 1
+                self.request_stats['response_times'].append(response_time)
+                
+                # Calculate average response time
+                if len(self.request_stats['response_times']) > 100:
+                    self.request_stats['response_times'] = self.request_stats['response_times'][-100:]
+                self.request_stats['average_response_time'] = np.mean(self.request_stats['response_times'])
             
             # Handle response
             if response.status_code == 200:
@@ -247,16 +318,17 @@ class PremiumWeatherAPI:
                 if not is_valid:
                     st.warning(f"⚠️ Data quality issues detected: {'; '.join(issues)}")
                 
-                # Cache successful response
-                if use_cache:
-                    self.cache[cache_key] = {
-                        'data': data,
-                        'timestamp': time.time(),
-                        'response_time': response_time,
-                        'quality_score': 100 - len(issues) * 10
-                    }
-                
-                self.request_stats['successful_requests'] += 1
+                with self._lock:
+                    # Cache successful response
+                    if use_cache:
+                        self.cache[cache_key] = {
+                            'data': data,
+                            'timestamp': time.time(),
+                            'response_time': response_time,
+                            'quality_score': 100 - len(issues) * 10
+                        }
+                    
+                    self.request_stats['successful_requests'] += 1
                 return data
                 
             else:
@@ -274,41 +346,25 @@ class PremiumWeatherAPI:
                                              f"API Error: {response.status_code}")
                 
                 # Track error statistics
-                self.request_stats['failed_requests'] += 1
-                error_code = str(response.status_code)
-                self.request_stats['api_errors'][error_code] = \
-                    self.request_stats['api_errors'].get(error_code, 0) + 1
+                self._record_failure(str(response.status_code))
                 
-                st.error(f"❌ {error_msg}")
-                return None
+                return self._request_failed(f"❌ {error_msg}")
                 
         except requests.exceptions.Timeout:
-            self.request_stats['failed_requests'] += 1
-            self.request_stats['api_errors']['timeout'] = \
-                self.request_stats['api_errors'].get('timeout', 0) + 1
-            st.error("❌ Request timeout. The weather service is taking too long to respond.")
-            return None
+            self._record_failure('timeout')
+            return self._request_failed("❌ Request timeout. The weather service is taking too long to respond.")
             
         except requests.exceptions.ConnectionError:
-            self.request_stats['failed_requests'] += 1
-            self.request_stats['api_errors']['connection'] = \
-                self.request_stats['api_errors'].get('connection', 0) + 1
-            st.error("❌ Connection error. Please check your internet connection.")
-            return None
+            self._record_failure('connection')
+            return self._request_failed("❌ Connection error. Please check your internet connection.")
             
         except requests.exceptions.JSONDecodeError:
-            self.request_stats['failed_requests'] += 1
-            self.request_stats['api_errors']['json_decode'] = \
-                self.request_stats['api_errors'].get('json_decode', 0) + 1
-            st.error("❌ Invalid response format from weather service.")
-            return None
+            self._record_failure('json_decode')
+            return self._request_failed("❌ Invalid response format from weather service.")
             
         except Exception as e:
-            self.request_stats['failed_requests'] += 1
-            self.request_stats['api_errors']['unknown'] = \
-                self.request_stats['api_errors'].get('unknown', 0) + 1
-            st.error(f"❌ Unexpected error: {str(e)}")
-            return None
+            self._record_failure('unknown')
+            return self._request_failed(f"❌ Unexpected error: {str(e)}")
     
     def get_current_weather_enhanced(self, lat: float, lon: float, 
                                    units: str = "metric") -> Optional[Dict]:
@@ -564,40 +620,7 @@ class PremiumWeatherAPI:
     
     def _get_aqi_health_info(self, aqi: int) -> Dict:
         """Get health information based on AQI level"""
-        aqi_info = {
-            1: {
-                'level': 'Good',
-                'description': 'Air quality is satisfactory',
-                'recommendations': ['Perfect for outdoor activities', 'No health precautions needed'],
-                'sensitive_groups': 'No restrictions'
-            },
-            2: {
-                'level': 'Fair',
-                'description': 'Air quality is acceptable',
-                'recommendations': ['Outdoor activities are generally safe', 'Sensitive individuals should be aware'],
-                'sensitive_groups': 'Very sensitive people might experience minor issues'
-            },
-            3: {
-                'level': 'Moderate',
-                'description': 'Sensitive groups may experience health effects',
-                'recommendations': ['Reduce outdoor activities if you feel symptoms', 'Limit prolonged outdoor exertion'],
-                'sensitive_groups': 'People with respiratory conditions should reduce outdoor activities'
-            },
-            4: {
-                'level': 'Poor',
-                'description': 'Health effects may be experienced by general population',
-                'recommendations': ['Limit outdoor activities', 'Wear a mask when outdoors', 'Keep windows closed'],
-                'sensitive_groups': 'Avoid outdoor activities'
-            },
-            5: {
-                'level': 'Very Poor',
-                'description': 'Health warnings of emergency conditions',
-                'recommendations': ['Avoid outdoor activities', 'Stay indoors', 'Use air purifiers if available'],
-                'sensitive_groups': 'Stay indoors and avoid any outdoor activities'
-            }
-        }
-        
-        return aqi_info.get(aqi, aqi_info[3])  # Default to moderate if unknown
+        return _AQI_HEALTH_INFO.get(aqi, _AQI_HEALTH_INFO[3])  # Default to moderate if unknown
     
     def _analyze_air_components(self, components: Dict) -> Dict:
         """Analyze individual air quality components"""
@@ -607,18 +630,9 @@ class PremiumWeatherAPI:
             'component_levels': {}
         }
         
-        # WHO air quality guidelines (µg/m³)
-        who_guidelines = {
-            'pm2_5': {'good': 15, 'moderate': 35, 'poor': 75},
-            'pm10': {'good': 45, 'moderate': 100, 'poor': 150},
-            'no2': {'good': 40, 'moderate': 100, 'poor': 200},
-            'o3': {'good': 100, 'moderate': 180, 'poor': 240},
-            'so2': {'good': 20, 'moderate': 80, 'poor': 250}
-        }
-        
         for component, value in components.items():
-            if component in who_guidelines:
-                guidelines = who_guidelines[component]
+            if component in _WHO_GUIDELINES:
+                guidelines = _WHO_GUIDELINES[component]
                 
                 if value > guidelines['poor']:
                     level = 'poor'
@@ -656,6 +670,7 @@ class PremiumWeatherAPI:
     def get_bulk_weather_data_async(self, locations: List[Tuple[float, float]], 
                                   units: str = "metric") -> Dict[str, Dict]:
         """Get weather data for multiple locations efficiently using async requests"""
+        import aiohttp
         
         async def fetch_weather(session, lat, lon):
             url = f"{self.base_url}/weather"
@@ -802,7 +817,10 @@ class PremiumWeatherAPI:
             
             data = self._make_request_with_analytics(url, params, 'current', use_cache=False)
             
-            if data and 'alerts' in data:
+            if data is None:
+                return None
+            
+            if 'alerts' in data:
                 enhanced_alerts = []
                 for alert in data['alerts']:
                     enhanced_alert = self._enhance_alert_data(alert)
@@ -1129,21 +1147,23 @@ class PremiumWeatherAPI:
     def clear_cache_selective(self, cache_types: List[str] = None):
         """Clear cache selectively by data type"""
         if cache_types is None:
-            self.cache.clear()
+            with self._lock:
+                self.cache.clear()
             st.success("🗑️ All cache cleared successfully!")
             return
         
         keys_to_remove = []
-        for key, cache_entry in self.cache.items():
-            # This is a simplified approach - in a real implementation,
-            # you'd need to track cache type in the cache entry
-            for cache_type in cache_types:
-                if cache_type in key:  # Simple heuristic
-                    keys_to_remove.append(key)
-                    break
-        
-        for key in keys_to_remove:
-            del self.cache[key]
+        with self._lock:
+            for key, cache_entry in self.cache.items():
+                # This is a simplified approach - in a real implementation,
+                # you'd need to track cache type in the cache entry
+                for cache_type in cache_types:
+                    if cache_type in key:  # Simple heuristic
+                        keys_to_remove.append(key)
+                        break
+            
+            for key in keys_to_remove:
+                del self.cache[key]
         
         st.success(f"🗑️ Cleared {len(keys_to_remove)} cache entries for types: {', '.join(cache_types)}")
     
@@ -1181,16 +1201,17 @@ class PremiumWeatherAPI:
     
     def reset_statistics(self):
         """Reset all usage statistics"""
-        self.request_stats = {
-            'total_requests': 0,
-            'successful_requests': 0,
-            'failed_requests': 0,
-            'cache_hits': 0,
-            'api_errors': {},
-            'average_response_time': 0,
-            'response_times': []
-        }
-        self.request_count = 0
-        self.burst_window = []
+        with self._lock:
+            self.request_stats = {
+                'total_requests': 0,
+                'successful_requests': 0,
+                'failed_requests': 0,
+                'cache_hits': 0,
+                'api_errors': {},
+                'average_response_time': 0,
+                'response_times': []
+            }
+            self.request_count = 0
+            self.burst_window = []
         
         st.success("📊 Usage statistics reset successfully!")
\ No newline at end of file